@@ -25,109 +25,362 @@ Endpoints:
 """
 
 # Standard library imports
-from flask import Blueprint, Flask, jsonify, request, make_response
+from flask import Blueprint, Flask, Response, g, request, make_response, stream_with_context
+from flask_compress import Compress
 from flask_cors import CORS
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from flask_restx import Api, Resource, fields, Namespace
 import sys
 import os
 import jwt
-import json
 import uuid
+import hashlib
+import threading
+import time
 import datetime
-from datetime import datetime, timedelta
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
-# Add project root to Python path for relative imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+import bcrypt
+import orjson
+from cachetools import TTLCache
+
+# Add project root to Python path for relative imports (guarded so repeated
+# imports don't stack duplicate entries that slow every subsequent import)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
-print("[DEBUG] [api_gateway] [startup] API Gateway starting up...")
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
-print("[DEBUG] [api_gateway] [startup] Environment variables loaded")
 
-# Import microservices and utilities
-from backend.microservices.summarization_service import run_summarization, process_articles
+# Import microservices and utilities. The summarization service is imported
+# lazily (see _get_summarization_service) so container cold starts don't pay
+# for the OpenAI client stack before serving /health or auth traffic.
 from backend.microservices.news_fetcher import fetch_news
 from backend.core.config import Config
+from backend.core.jwt_fast import InvalidTokenError, verify_hs256
+from backend.core.orjson_provider import OrjsonProvider
 from backend.core.utils import setup_logger, log_exception
-from backend.microservices.auth_service import load_users
-from backend.microservices.news_storage import store_article_in_supabase, log_user_search, add_bookmark, get_user_bookmarks, delete_bookmark
+from backend.microservices.auth_service import (
+    add_user,
+    get_user_by_id,
+    get_user_by_username,
+    verify_credentials,
+)
+from backend.microservices.news_storage import store_article_in_supabase, store_articles_bulk, log_user_search, log_user_searches_bulk, add_bookmark, get_user_bookmarks, delete_bookmark
 from backend.microservices.story_tracking_service import get_tracked_stories, create_tracked_story, get_story_details, delete_tracked_story
 
 
 # Initialize logger for the API Gateway
 logger = setup_logger(__name__)
-print("[DEBUG] [api_gateway] [startup] Logger initialized")
+logger.debug("Logger initialized")
 
 # Initialize Flask application with security configurations
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # JWT secret key for token signing
-print("[DEBUG] [api_gateway] [startup] Flask app initialized with secret key")
+# Route Flask's own JSON machinery (get_json, error handlers) through orjson
+app.json = OrjsonProvider(app)
+logger.debug("Flask app initialized with secret key")
+
+# The HMAC secret as bytes, encoded once (PyJWT's encode path — still used for
+# issuing tokens — would otherwise re-encode the str on every call). Token
+# verification goes through backend.core.jwt_fast.verify_hs256, a specialized
+# HS256-only path without PyJWT's per-call algorithm dispatch and option handling.
+_JWT_SECRET = app.config['SECRET_KEY'].encode()
+
+# Origins allowed to call the gateway, computed once at import time
+ALLOWED_ORIGINS = ["http://localhost:5173", "http://localhost:5001"]
 
 # Configure CORS to allow specific origins and methods
-CORS(app, 
-     origins=["http://localhost:5173", "http://localhost:5001"], 
-     supports_credentials=True, 
-     allow_headers=["Content-Type", "Authorization"], 
+CORS(app,
+     origins=ALLOWED_ORIGINS,
+     supports_credentials=True,
+     allow_headers=["Content-Type", "Authorization"],
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-print("[DEBUG] [api_gateway] [startup] CORS configured")
+logger.debug("CORS configured")
+
+# Compress JSON responses (article lists gzip down ~70-80%); the size floor
+# keeps tiny status payloads from paying compression overhead for nothing
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+logger.debug("Response compression configured")
+
+# Rate limiter for the credential endpoints only (no default limits): each
+# login costs a deliberate ~100ms bcrypt verify, so unthrottled retries are
+# a cheap CPU-exhaustion vector
+limiter = Limiter(get_remote_address, app=app, storage_uri="memory://")
+logger.debug("Rate limiter configured")
 
 # Initialize Flask-RestX for API documentation
 api = Api(app, version='1.0', title='News Aggregator API',
           description='A news aggregation and summarization API')
-print("[DEBUG] [api_gateway] [startup] Flask-RestX API initialized")
+logger.debug("Flask-RestX API initialized")
+
+@api.representation('application/json')
+def _output_orjson(data, code, headers=None):
+    """Serialize RestX dict returns with orjson instead of the stdlib encoder.
+
+    Handlers that return `dict, status` tuples (and RestX's own error/abort
+    payloads) otherwise go through the pure-Python json module; orjson encodes
+    in C, emits bytes directly and handles datetimes natively.
+    """
+    response = Response(orjson.dumps(data), status=code, mimetype='application/json')
+    if headers:
+        response.headers.extend(headers)
+    return response
 
 # Define API namespaces for logical grouping of endpoints
 news_ns = api.namespace('api/news', description='News operations')
-health_ns = api.namespace('health', description='Health check operations')
-summarize_ns = api.namespace('summarize', description='Text summarization operations')
 user_ns = api.namespace('api/user', description='User operations')
 auth_ns = api.namespace('api/auth', description='Authentication operations')
-bookmark_ns = api.namespace('api/bookmarks', description='Bookmark operations')
 story_tracking_ns = api.namespace('api/story_tracking', description='Story tracking operations')
-print("[DEBUG] [api_gateway] [startup] API namespaces defined")
+logger.debug("API namespaces defined")
+
+# Hot endpoints (health, summarize, news fetch, bookmarks) are served as plain
+# Flask views on this blueprint: they skip Flask-RestX's Resource dispatch,
+# content negotiation and error-handler machinery, which is pure per-request
+# Python overhead for simple JSON responses. The RestX Api stays mounted for
+# Swagger on the lower-traffic namespaces above.
+hot = Blueprint('hot', __name__)
+
+def ojson(payload, status=200):
+    """Build a JSON response with orjson instead of flask.jsonify.
+
+    orjson serializes in C (and handles datetime natively), which is several
+    times faster than the stdlib encoder for the article-list payloads these
+    endpoints return, and skips the extra make_response wrapping.
+
+    Args:
+        payload: The JSON-serializable response body.
+        status (int, optional): HTTP status code. Defaults to 200.
+
+    Returns:
+        Response: A Flask response with an application/json body.
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def ojson_conditional(payload):
+    """Build a JSON response with an ETag, answering revalidations with 304.
+
+    Meant for polled read endpoints (tracked stories) whose payload is often
+    unchanged between requests from the same client: a matching If-None-Match
+    skips the response body — and with it compression and the TCP send —
+    entirely. blake2b is the fastest stdlib hash at this payload size.
+
+    Args:
+        payload: The JSON-serializable response body.
+
+    Returns:
+        Response: A 304 with the ETag on revalidation match, else a 200 with
+        the body and ETag set.
+    """
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if etag in request.if_none_match:
+        # Repeat the 200's Cache-Control: a bare 304 would fall through to
+        # the after_request no-store hook, telling the client to discard the
+        # very cached entry this revalidation just confirmed
+        return Response(status=304, headers={
+            'ETag': '"%s"' % etag,
+            'Cache-Control': 'private, max-age=0, must-revalidate',
+        })
+    response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    # private: browsers may keep it for revalidation, shared caches may not
+    response.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return response
+
+# Process-local cache of verified JWT payloads keyed by a hash of the raw token.
+# Repeated requests with the same bearer token skip the HMAC verification and
+# JSON parsing entirely. Decode failures are never cached, and cached payloads
+# are re-checked against their 'exp' claim so an expired token is never served
+# from the cache.
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+def _verify_cached(token):
+    """Decode a JWT token, serving repeated verifications from a short TTL cache.
+
+    Accepts both audiences the gateway sees — Supabase-issued tokens carry
+    aud='authenticated', locally issued signup/login tokens carry none — and
+    caches the successful payload under the token hash alone. A repeat
+    request therefore skips verification entirely whichever kind of token it
+    presents, instead of retrying the wrong audience first on every call.
+
+    Args:
+        token (str): The raw JWT token extracted from the Authorization header.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        jwt_fast.InvalidTokenError: If the token is invalid or expired.
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None and payload.get('exp', now + 1) > now:
+        return payload
+    try:
+        payload = verify_hs256(token, _JWT_SECRET, audience='authenticated')
+    except InvalidTokenError:
+        payload = verify_hs256(token, _JWT_SECRET, audience=None)
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
+
+# Shared pool for fanning out blocking Supabase round-trips. Storing N
+# articles sequentially costs N network RTTs; submitting them here bounds
+# the endpoint latency to roughly the slowest single call.
+_io_pool = ThreadPoolExecutor(max_workers=16)
+
+def _log_searches_background(user_id, article_ids, session_id):
+    """Run the bulk search-history insert off the request thread.
+
+    Fire-and-forget pool tasks swallow exceptions, so failures are logged
+    here instead of being silently dropped.
+    """
+    try:
+        log_user_searches_bulk(user_id, article_ids, session_id)
+    except Exception as e:
+        logger.error(f"Error logging user searches: {str(e)}")
+
+# The per-keyword TTL cache lives in news_fetcher.fetch_news itself, so the
+# story-tracking service shares it; this alias survives for the gateway's
+# existing call sites.
+cached_fetch_news = fetch_news
+
+def _store_and_log(article, user_id, session_id):
+    """Store one article and log the user's search in a single pooled task.
+
+    Fusing both round-trips per article keeps the pipeline full: the search
+    log for one article overlaps the store of the next rather than running
+    as a second sequential pass.
+
+    Args:
+        article (dict): Article data to persist.
+        user_id (str or None): User to log the search for; skipped if falsy.
+        session_id (str): Session identifier for the search-history record.
+
+    Returns:
+        str: The stored article's ID.
+    """
+    article_id = store_article_in_supabase(article)
+    if user_id:
+        log_user_search(user_id, article_id, session_id)
+    return article_id
 
 def token_required(f):
     """Decorator to protect routes that require authentication.
-    
-    This decorator validates the JWT token in the Authorization header.
-    It ensures that only authenticated users can access protected endpoints.
-    
+
+    The Authorization header is parsed and verified once per request by the
+    before_request hook below; this decorator only checks the outcome stashed
+    on flask.g, so protected endpoints pay no extra parsing or verification.
+
     Args:
         f: The function to be decorated.
-        
+
     Returns:
         decorated: The decorated function that includes token validation.
-        
+
     Raises:
         401: If the token is missing or invalid.
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        print("[DEBUG] [api_gateway] [token_required] Checking token in request")
-        auth_header = request.headers.get('Authorization')
-        if not auth_header:
-            print("[DEBUG] [api_gateway] [token_required] Authorization header missing")
-            return {'error': 'Authorization header missing'}, 401
-        try:
-            token = auth_header.split()[1]  # Extract token from 'Bearer <token>'
-            print(f"[DEBUG] [api_gateway] [token_required] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'],audience='authenticated')
-            print(f"[DEBUG] [api_gateway] [token_required] Token decoded successfully, user: {payload.get('sub', 'unknown')}")
-
+        # Common path: payload already verified by the hook, no exception
+        # machinery and no header re-parse
+        if g.get('jwt_payload') is not None:
             return f(*args, **kwargs)
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [token_required] Token validation error: {str(e)}")
-            return {'error': 'Invalid token', 'message': str(e)}, 401
+        if not request.headers.get('Authorization'):
+            logger.debug("Authorization header missing")
+            return {'error': 'Authorization header missing'}, 401
+        logger.debug("Token validation error: %s", g.jwt_error)
+        return {'error': 'Invalid token', 'message': g.jwt_error or 'Token verification failed'}, 401
     return decorated
 
-# Define API models for request/response documentation
-article_model = api.model('Article', {
-    'article_text': fields.String(required=True, description='The text to summarize')
-})
+# Headers for answering CORS preflights without touching the routing table.
+# Max-Age lets browsers cache the preflight verdict for a day, so most clients
+# only ever pay the OPTIONS round-trip once per endpoint.
+_PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Max-Age': '86400',
+    'Vary': 'Origin',
+}
+
+@app.before_request
+def _short_circuit_preflight():
+    """Answer CORS preflights before routing, JWT parsing or RestX dispatch.
+
+    OPTIONS requests never carry a bearer token or a body worth inspecting,
+    so everything after this handler is wasted work for them. Unknown origins
+    fall through to Flask-CORS, which answers without the allow headers.
+    """
+    if request.method != 'OPTIONS':
+        return
+    origin = request.headers.get('Origin')
+    if origin not in ALLOWED_ORIGINS:
+        return
+    response = Response(status=204, headers=_PREFLIGHT_HEADERS)
+    response.headers['Access-Control-Allow-Origin'] = origin
+    return response
+
+@app.before_request
+def _load_jwt_payload():
+    """Parse and verify the bearer token exactly once per request.
+
+    Several endpoint bodies (bookmarks, story tracking, profile) need the
+    decoded payload in addition to the token_required gate; doing the header
+    split and verification here means neither is repeated downstream. The
+    verified payload and user id are stashed on flask.g, with any
+    verification error kept for token_required to report.
+    """
+    g.jwt_payload = None
+    g.jwt_error = None
+    g.user_id = None
+    auth_header = request.headers.get('Authorization')
+    if not auth_header:
+        return
+    # A fixed-offset slice instead of split(): one substring, no list
+    # allocation, and only the Bearer scheme is accepted
+    if auth_header[:7].lower() != 'bearer ':
+        g.jwt_error = 'Invalid Authorization header format'
+        return
+    token = auth_header[7:]
+    if not token:
+        g.jwt_error = 'Invalid Authorization header format'
+        return
+    try:
+        payload = _verify_cached(token)
+    except Exception as e:
+        logger.debug("Token validation error: %s", str(e))
+        g.jwt_error = str(e)
+        return
+    logger.debug("Token decoded successfully, user: %s", payload.get('sub', 'unknown'))
+    g.jwt_payload = payload
+    g.user_id = payload.get('sub') or payload.get('id')
+
+@app.after_request
+def _no_store_for_authenticated(response):
+    """Keep authenticated responses (profile, bookmarks, stories) out of caches.
+
+    Any response produced for a valid bearer token carries user data;
+    no-store stops intermediaries from ever persisting it. Endpoints that
+    set their own Cache-Control (the ETag'd story reads) are left alone.
+    """
+    if g.get('jwt_payload') is not None and 'Cache-Control' not in response.headers:
+        response.headers['Cache-Control'] = 'no-store'
+    return response
 
+# Define API models for request/response documentation
 user_profile_model = api.model('UserProfile', {
     'id': fields.String(description='User ID'),
     'username': fields.String(description='Username'),
@@ -146,96 +399,140 @@ signup_model = api.model('Signup', {
     'lastName': fields.String(required=False, description='Last name')
 })
 
-print("[DEBUG] [api_gateway] [startup] API models defined")
+logger.debug("API models defined")
 
 # Health check endpoint for system monitoring
-@health_ns.route('/')
-class HealthCheck(Resource):
-    def get(self):
-        """Check the health status of the API Gateway.
-        
-        Returns:
-            dict: A dictionary containing the health status.
-            int: HTTP 200 status code indicating success.
-        """
-        print("[DEBUG] [api_gateway] [health_check] Called")
-        return {"status": "API Gateway is healthy"}, 200
+@hot.route('/health/', methods=['GET'])
+def health_check():
+    """Check the health status of the API Gateway.
 
-# Endpoint for article summarization
-@summarize_ns.route('/')
-class Summarize(Resource):
-    @summarize_ns.expect(article_model)
-    def post(self):
-        """Summarize the provided article text.
-        
-        Expects a JSON payload with 'article_text' field.
-        Uses the summarization service to generate a concise summary.
-        
-        Returns:
-            dict: Contains the generated summary.
-            int: HTTP 200 status code on success.
-        """
-        print("[DEBUG] [api_gateway] [summarize] Called")
-        data = request.get_json()
-        article_text = data.get('article_text', '')
-        print(f"[DEBUG] [api_gateway] [summarize] Summarizing text of length: {len(article_text)}")
-        summary = run_summarization(article_text)
-        print(f"[DEBUG] [api_gateway] [summarize] Summarization complete, summary length: {len(summary)}")
-        return {"summary": summary}, 200
-
-@news_ns.route('/fetch')
-class NewsFetch(Resource):
-    @news_ns.param('keyword', 'Search keyword for news')
-    @news_ns.param('user_id', 'User ID for logging search history')
-    @news_ns.param('session_id', 'Session ID for tracking requests')
-    def get(self):
-        """Fetch news articles based on a keyword and store them in Supabase.
-        
-        This endpoint fetches news articles matching the provided keyword,
-        stores them in Supabase, and logs the search history if a user ID is provided.
-        
-        Args:
-            keyword (str): The search term for fetching news articles.
-            user_id (str, optional): User ID for logging search history.
-            session_id (str): Session ID for tracking the request.
-            
-        Returns:
-            dict: Contains the stored article IDs and success status.
-            int: HTTP 200 on success, 500 on error.
-        """
-        try:
-            keyword = request.args.get('keyword', '')
-            user_id = request.args.get('user_id')  # optional
-            session_id = request.args.get('session_id')
-            print(f"[DEBUG] [api_gateway] [news_fetch] Called with keyword: '{keyword}', user_id: {user_id}, session_id: {session_id}")
+    Returns:
+        dict: A dictionary containing the health status.
+        int: HTTP 200 status code indicating success.
+    """
+    logger.debug("Called")
+    # Cacheable for 10s so an edge proxy/CDN can absorb load-balancer probes
+    return {"status": "API Gateway is healthy"}, 200, {'Cache-Control': 'public, max-age=10'}
 
-            print(f"[DEBUG] [api_gateway] [news_fetch] Fetching news articles for keyword: '{keyword}'")
-            articles = fetch_news(keyword)  # This returns a list of articles.
-            print(f"[DEBUG] [api_gateway] [news_fetch] Found {len(articles) if articles else 0} articles")
-            stored_article_ids = []
+# Lazily imported summarization service. Its import chain (OpenAI client,
+# Supabase) is only needed by /summarize and /api/news/process; deferring it
+# keeps cold starts fast for instances that only ever see health checks and
+# auth traffic.
+_summarization_service = None
+_summarization_import_lock = threading.Lock()
 
-            for article in articles:
-                print(f"[DEBUG] [api_gateway] [news_fetch] Storing article: {article.get('title', 'No title')}")
-                article_id = store_article_in_supabase(article)
-                stored_article_ids.append(article_id)
-                print(f"[DEBUG] [api_gateway] [news_fetch] Stored article with ID: {article_id}")
+def _get_summarization_service():
+    """Import and cache the summarization service module on first use.
 
-                if user_id:
-                    print(f"[DEBUG] [api_gateway] [news_fetch] Logging search for user {user_id}, article {article_id}")
-                    log_user_search(user_id, article_id, session_id)
+    Returns:
+        module: backend.microservices.summarization_service.
+    """
+    global _summarization_service
+    if _summarization_service is None:
+        with _summarization_import_lock:
+            if _summarization_service is None:
+                from backend.microservices import summarization_service
+                _summarization_service = summarization_service
+    return _summarization_service
 
-            print(f"[DEBUG] [api_gateway] [news_fetch] Returning {len(stored_article_ids)} article IDs")
-            return make_response(jsonify({
-                'status': 'success',
-                'data': stored_article_ids
-            }), 200)
+# Endpoint for article summarization
+@hot.route('/summarize/', methods=['POST'])
+def summarize():
+    """Summarize the provided article text.
 
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [news_fetch] Error: {str(e)}")
-            return make_response(jsonify({
+    Expects a JSON payload with 'article_text' field.
+    Uses the summarization service to generate a concise summary.
+
+    Returns:
+        dict: Contains the generated summary.
+        int: HTTP 200 status code on success.
+    """
+    logger.debug("Called")
+    data = request.get_json()
+    article_text = data.get('article_text', '')
+    # Don't spend an OpenAI round-trip on an empty body
+    if not article_text.strip():
+        return {"summary": ""}, 200
+    logger.debug("Summarizing text of length: %s", len(article_text))
+    summary = _get_summarization_service().run_summarization(article_text)
+    logger.debug("Summarization complete, summary length: %s", len(summary))
+    return {"summary": summary}, 200
+
+@hot.route('/api/news/fetch', methods=['GET'])
+def news_fetch():
+    """Fetch news articles based on a keyword and store them in Supabase.
+
+    This endpoint fetches news articles matching the provided keyword,
+    stores them in Supabase, and logs the search history if a user ID is provided.
+
+    Query Args:
+        keyword (str): The search term for fetching news articles.
+        user_id (str, optional): User ID for logging search history.
+        session_id (str): Session ID for tracking the request.
+
+    Returns:
+        dict: Contains the stored article IDs and success status.
+        int: HTTP 200 on success, 500 on error.
+    """
+    try:
+        keyword = request.args.get('keyword', '')
+        user_id = request.args.get('user_id')  # optional
+        session_id = request.args.get('session_id')
+        logger.debug("Called with keyword: '%s', user_id: %s, session_id: %s", keyword, user_id, session_id)
+
+        logger.debug("Fetching news articles for keyword: '%s'", keyword)
+        articles = cached_fetch_news(keyword)  # This returns a list of articles.
+        if articles is None:
+            # Upstream failure (fetch_news returns None after logging the
+            # cause) — distinct from a keyword with no results. Surfacing it
+            # as an error keeps the cacheable success below from letting
+            # edge caches serve an empty payload for the outage's duration.
+            logger.debug("Upstream news fetch failed for keyword: '%s'", keyword)
+            return ojson({
                 'status': 'error',
-                'message': str(e)
-            }), 500)
+                'message': 'Failed to fetch news from upstream provider'
+            }, 502)
+        logger.debug("Found %s articles", len(articles))
+
+        # Opt-in NDJSON streaming: store per article on the pool and emit
+        # each id as its round-trip completes, so first-byte latency is one
+        # store, not all of them
+        if request.args.get('stream'):
+            futures = [
+                _io_pool.submit(_store_and_log, article, user_id, session_id)
+                for article in articles
+            ]
+            def generate():
+                for future in futures:
+                    yield orjson.dumps({'id': future.result()}) + b'\n'
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        # Buffered path: one bulk upsert for the whole batch and one bulk
+        # search-log insert instead of 2N per-article round-trips. The
+        # search log isn't part of the response, so it runs on the pool
+        # and the response doesn't wait for its round-trip.
+        stored_article_ids = store_articles_bulk(articles)
+        if user_id:
+            _io_pool.submit(_log_searches_background, user_id, stored_article_ids, session_id)
+        logger.debug("Stored %s articles", len(stored_article_ids))
+
+        logger.debug("Returning %s article IDs", len(stored_article_ids))
+        response = ojson({
+            'status': 'success',
+            'data': stored_article_ids
+        }, 200)
+        # Idempotent per keyword, so an edge cache may serve it briefly; Vary
+        # on Authorization keeps per-user responses from crossing users
+        response.headers['Cache-Control'] = 'public, max-age=60, stale-while-revalidate=30'
+        response.headers['Vary'] = 'Authorization'
+        return response
+
+    except Exception as e:
+        logger.debug("Error: %s", str(e))
+        return ojson({
+            'status': 'error',
+            'message': str(e)
+        }, 500)
 
 
 @news_ns.route('/process')
@@ -256,10 +553,10 @@ class NewsProcess(Resource):
         """
         try:
             session_id = request.args.get('session_id')
-            print(f"[DEBUG] [api_gateway] [news_process] Called with session_id: {session_id}")
-            print("[DEBUG] [api_gateway] [news_process] Processing articles...")
-            summarized_articles = process_articles(session_id)
-            print(f"[DEBUG] [api_gateway] [news_process] Processed {len(summarized_articles) if summarized_articles else 0} articles")
+            logger.debug("Called with session_id: %s", session_id)
+            logger.debug("Processing articles...")
+            summarized_articles = _get_summarization_service().process_articles(session_id)
+            logger.debug("Processed %s articles", len(summarized_articles) if summarized_articles else 0)
             return {
                 'status': 'success',
                 'message': 'Articles processed and summarized successfully',
@@ -267,7 +564,7 @@ class NewsProcess(Resource):
                 'session_id': session_id
             }, 200
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [news_process] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error processing articles: {str(e)}")
             return {
                 'status': 'error',
@@ -296,66 +593,59 @@ class Signup(Resource):
             dict: Contains user data (excluding password) and JWT token.
             int: HTTP 201 on success, 400 on validation error, 500 on server error.
         """
-        print("[DEBUG] [api_gateway] [signup] User signup endpoint called")
+        logger.debug("User signup endpoint called")
         data = request.get_json()
         username = data.get('username')
         password = data.get('password')
         email = data.get('email')
         firstName = data.get('firstName', '')
         lastName = data.get('lastName', '')
-        print(f"[DEBUG] [api_gateway] [signup] Request for username: {username}, email: {email}")
+        logger.debug("Request for username: %s, email: %s", username, email)
 
         if not username or not password or not email:
-            print("[DEBUG] [api_gateway] [signup] Validation failed: missing required fields")
+            logger.debug("Validation failed: missing required fields")
             return {'error': 'Username, password, and email are required'}, 400
 
-        users = load_users()
-        print(f"[DEBUG] [api_gateway] [signup] Loaded {len(users)} existing users")
-
         # Check if username already exists
-        if any(u.get('username') == username for u in users):
-            print(f"[DEBUG] [api_gateway] [signup] Username {username} already exists")
+        if get_user_by_username(username) is not None:
+            logger.debug("Username %s already exists", username)
             return {'error': 'Username already exists'}, 400
 
         # Create new user with unique ID
         new_user = {
-            'id': str(uuid.uuid4()),
+            'id': uuid.uuid4().hex,
             'username': username,
-            'password': password,
+            'password_hash': bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode(),
             'email': email,
             'firstName': firstName,
             'lastName': lastName
         }
-        print(f"[DEBUG] [api_gateway] [signup] Created new user with ID: {new_user['id']}")
+        logger.debug("Created new user with ID: %s", new_user['id'])
         
-        users.append(new_user)
-
-        try:
-            # Save updated users list
-            print("[DEBUG] [api_gateway] [signup] Saving updated users list")
-            with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'users.txt'), 'w') as f:
-                json.dump(users, f, indent=4)
-            print("[DEBUG] [api_gateway] [signup] Users list saved successfully")
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [signup] Error saving user data: {str(e)}")
-            return {'error': 'Failed to save user data', 'message': str(e)}, 500
+        # Register the user in the auth service's index; its background writer
+        # persists the file, so the response doesn't wait on disk I/O.
+        add_user(new_user)
+        logger.debug("User queued for persistence")
 
         # Generate JWT token
-        print("[DEBUG] [api_gateway] [signup] Generating JWT token")
+        logger.debug("Generating JWT token")
         token = jwt.encode({
             'id': new_user['id'],
             'username': new_user['username'],
-            'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+            'exp': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
         }, app.config['SECRET_KEY'], algorithm='HS256')
-        print(f"[DEBUG] [api_gateway] [signup] Token generated: {token[:10]}...")
+        logger.debug("Token generated: %s...", token[:10])
 
         # Exclude password from response
-        user_data = {k: new_user[k] for k in new_user if k != 'password'}
-        print("[DEBUG] [api_gateway] [signup] Signup successful")
+        user_data = {k: new_user[k] for k in new_user if k not in ('password', 'password_hash')}
+        logger.debug("Signup successful")
         return {'message': 'User registered successfully', 'user': user_data, 'token': token}, 201
 
 @auth_ns.route('/login')
 class Login(Resource):
+    # Cap per-IP attempts: the bcrypt verify below is deliberately expensive,
+    # so a retry flood is also a CPU flood
+    @limiter.limit("10 per minute")
     def post(self):
         """Authenticate user and generate JWT token.
         
@@ -371,198 +661,185 @@ class Login(Resource):
             dict: Contains user data (excluding password) and JWT token.
             int: HTTP 200 on success, 400 on validation error, 401 on invalid credentials.
         """
-        print("[DEBUG] [api_gateway] [login] Login endpoint called")
+        logger.debug("Login endpoint called")
         data = request.get_json()
         username = data.get('username')
         password = data.get('password')
-        print(f"[DEBUG] [api_gateway] [login] Login attempt for username: {username}")
+        logger.debug("Login attempt for username: %s", username)
         
         if not username or not password:
-            print("[DEBUG] [api_gateway] [login] Validation failed: missing username or password")
+            logger.debug("Validation failed: missing username or password")
             return {'error': 'Username and password are required'}, 400
         
-        users = load_users()
-        print(f"[DEBUG] [api_gateway] [login] Loaded {len(users)} users")
-        user = next((u for u in users if u.get('username') == username and u.get('password') == password), None)
-        
+        user = verify_credentials(username, password)
+
         if not user:
-            print(f"[DEBUG] [api_gateway] [login] Invalid credentials for username: {username}")
+            logger.debug("Invalid credentials for username: %s", username)
             return {'error': 'Invalid credentials'}, 401
         
-        print(f"[DEBUG] [api_gateway] [login] Valid credentials for user: {user.get('id')}")
-        print("[DEBUG] [api_gateway] [login] Generating JWT token")
+        logger.debug("Valid credentials for user: %s", user.get('id'))
+        logger.debug("Generating JWT token")
         token = jwt.encode({
             'id': user['id'],
             'username': user['username'],
-            'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+            'exp': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
         }, app.config['SECRET_KEY'], algorithm='HS256')
-        print(f"[DEBUG] [api_gateway] [login] Token generated: {token[:10]}...")
+        logger.debug("Token generated: %s...", token[:10])
         
-        user_data = {k: user[k] for k in user if k != 'password'}
-        print("[DEBUG] [api_gateway] [login] Login successful")
+        user_data = {k: user[k] for k in user if k not in ('password', 'password_hash')}
+        logger.debug("Login successful")
         return {'token': token, 'user': user_data}
 
+# Fixed projection returned by the profile endpoint; a direct dict build plus
+# orjson beats Flask-RestX's reflective per-field marshalling on this hot path
+_PROFILE_FIELDS = ('id', 'username', 'email', 'firstName', 'lastName', 'avatarUrl')
+
 @user_ns.route('/profile')
 class UserProfile(Resource):
     @token_required
-    @user_ns.marshal_with(user_profile_model)
     def get(self):
         """Retrieve authenticated user's profile information.
-        
+
         Requires a valid JWT token in the Authorization header.
         Returns the user's profile data excluding sensitive information.
-        
+
         Returns:
             dict: User profile data including id, username, email, and names.
             int: HTTP 200 on success, 404 if user not found.
         """
-        print("[DEBUG] [api_gateway] [user_profile] Called")
-        auth_header = request.headers.get('Authorization')
-        token = auth_header.split()[1]
-        print(f"[DEBUG] [api_gateway] [user_profile] Decoding token: {token[:10]}...")
-        payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-        print(f"[DEBUG] [api_gateway] [user_profile] Looking up user with ID: {payload.get('id')}")
-        
-        users = load_users()
-        user = next((u for u in users if u.get('id') == payload.get('id')), None)
+        logger.debug("Called")
+        payload = g.jwt_payload
+        logger.debug("Looking up user with ID: %s", payload.get('id'))
+
+        user = get_user_by_id(payload.get('id'))
         if not user:
-            print(f"[DEBUG] [api_gateway] [user_profile] User not found with ID: {payload.get('id')}")
+            logger.debug("User not found with ID: %s", payload.get('id'))
             return {'error': 'User not found'}, 404
             
-        print(f"[DEBUG] [api_gateway] [user_profile] Found user: {user.get('username')}")
-        return {k: user[k] for k in user if k != 'password'}, 200
-
-@bookmark_ns.route('/')
-class Bookmark(Resource):
-    @token_required
-    def get(self):
-        """Retrieve all bookmarks for the authenticated user.
-        
-        Requires a valid JWT token in the Authorization header.
-        Returns a list of bookmarked articles for the current user.
-        
-        Returns:
-            dict: Contains list of bookmarked articles and success status.
-            int: HTTP 200 on success, 500 on error.
-        """
-        try:
-            print("[DEBUG] [api_gateway] [get_bookmarks] Called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [get_bookmarks] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'],audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [get_bookmarks] Getting bookmarks for user: {user_id}")
-
-            bookmarks = get_user_bookmarks(user_id)
-            print(f"[DEBUG] [api_gateway] [get_bookmarks] Found {len(bookmarks)} bookmarks")
+        logger.debug("Found user: %s", user.get('username'))
+        return ojson({k: user[k] for k in _PROFILE_FIELDS if k in user}, 200)
 
-            return {
-                'status': 'success',
-                'data': bookmarks
-            }, 200
+@hot.route('/api/bookmarks/', methods=['GET'])
+@token_required
+def bookmarks_get():
+    """Retrieve all bookmarks for the authenticated user.
 
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [get_bookmarks] Error: {str(e)}")
-            logger.error(f"Error fetching bookmarks: {str(e)}")
-            return {
-                'status': 'error',
-                'message': str(e)
-            }, 500
+    Requires a valid JWT token in the Authorization header.
+    Returns a list of bookmarked articles for the current user.
 
-    @token_required
-    def post(self):
-        """Add a new bookmark for the authenticated user.
-        
-        Requires a valid JWT token in the Authorization header.
-        Creates a bookmark linking the user to a specific news article.
-        
-        Expected JSON payload:
-        {
-            'news_id': str (required)
-        }
-        
-        Returns:
-            dict: Contains bookmark ID and success status.
-            int: HTTP 201 on success, 400 on validation error, 500 on server error.
-        """
-        try:
-            print("[DEBUG] [api_gateway] [add_bookmark] Called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [add_bookmark] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'],audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [add_bookmark] Adding bookmark for user: {user_id}")
-
-            data = request.get_json()
-            news_id = data.get('news_id')
-            print(f"[DEBUG] [api_gateway] [add_bookmark] News article ID: {news_id}")
-
-            if not news_id:
-                print("[DEBUG] [api_gateway] [add_bookmark] News article ID missing in request")
-                return {'error': 'News article ID is required'}, 400
-
-            print(f"[DEBUG] [api_gateway] [add_bookmark] Adding bookmark for user {user_id}, article {news_id}")
-            bookmark = add_bookmark(user_id, news_id)
-            print(f"[DEBUG] [api_gateway] [add_bookmark] Bookmark added with ID: {bookmark['id'] if isinstance(bookmark, dict) else bookmark}")
-            
-            return {
-                'status': 'success',
-                'message': 'Bookmark added successfully',
-                'data': {
-                    'bookmark_id': bookmark['id'] if isinstance(bookmark, dict) else bookmark
-                }
-            }, 201
-
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [add_bookmark] Error: {str(e)}")
-            logger.error(f"Error adding bookmark: {str(e)}")
-            return {
-                'status': 'error',
-                'message': str(e)
-            }, 500
-
-@bookmark_ns.route('/<string:bookmark_id>')
-class BookmarkDelete(Resource):
-    @token_required
-    def delete(self, bookmark_id):
-        """Remove a bookmark for a news article.
+    Returns:
+        dict: Contains list of bookmarked articles and success status.
+        int: HTTP 200 on success, 500 on error.
+    """
+    try:
+        logger.debug("Called")
+        user_id = g.user_id
+        logger.debug("Getting bookmarks for user: %s", user_id)
+
+        bookmarks = get_user_bookmarks(user_id)
+        logger.debug("Found %s bookmarks", len(bookmarks))
+
+        return ojson({
+            'status': 'success',
+            'data': bookmarks
+        }, 200)
+
+    except Exception as e:
+        logger.debug("Error: %s", str(e))
+        logger.error(f"Error fetching bookmarks: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+@hot.route('/api/bookmarks/', methods=['POST'])
+@token_required
+def bookmarks_post():
+    """Add a new bookmark for the authenticated user.
+
+    Requires a valid JWT token in the Authorization header.
+    Creates a bookmark linking the user to a specific news article.
+
+    Expected JSON payload:
+    {
+        'news_id': str (required)
+    }
 
-        Requires a valid JWT token in the Authorization header.
-        Deletes the specified bookmark for the authenticated user.
+    Returns:
+        dict: Contains bookmark ID and success status.
+        int: HTTP 201 on success, 400 on validation error, 500 on server error.
+    """
+    try:
+        logger.debug("Called")
+        user_id = g.user_id
+        logger.debug("Adding bookmark for user: %s", user_id)
 
-        Args:
-            bookmark_id (str): The ID of the bookmark to be deleted.
+        data = request.get_json()
+        news_id = data.get('news_id')
+        logger.debug("News article ID: %s", news_id)
+
+        if not news_id:
+            logger.debug("News article ID missing in request")
+            return {'error': 'News article ID is required'}, 400
+
+        logger.debug("Adding bookmark for user %s, article %s", user_id, news_id)
+        bookmark = add_bookmark(user_id, news_id)
+        logger.debug("Bookmark added with ID: %s", bookmark['id'] if isinstance(bookmark, dict) else bookmark)
+
+        return {
+            'status': 'success',
+            'message': 'Bookmark added successfully',
+            'data': {
+                'bookmark_id': bookmark['id'] if isinstance(bookmark, dict) else bookmark
+            }
+        }, 201
+
+    except Exception as e:
+        logger.debug("Error: %s", str(e))
+        logger.error(f"Error adding bookmark: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+@hot.route('/api/bookmarks/<string:bookmark_id>', methods=['DELETE'])
+@token_required
+def bookmarks_delete(bookmark_id):
+    """Remove a bookmark for a news article.
+
+    Requires a valid JWT token in the Authorization header.
+    Deletes the specified bookmark for the authenticated user.
 
-        Returns:
-            dict: Contains success message.
-            int: HTTP 200 on success, 500 on error.
-        """
-        try:
-            print(f"[DEBUG] [api_gateway] [delete_bookmark] Called for bookmark: {bookmark_id}")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [delete_bookmark] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'],audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [delete_bookmark] Deleting bookmark {bookmark_id} for user {user_id}")
-
-            result = delete_bookmark(user_id, bookmark_id)
-            print(f"[DEBUG] [api_gateway] [delete_bookmark] Deletion result: {result}")
-            
-            return {
-                'status': 'success',
-                'message': 'Bookmark removed successfully'
-            }, 200
+    Args:
+        bookmark_id (str): The ID of the bookmark to be deleted.
 
-        except Exception as e:
-            print(f"[DEBUG] [api_gateway] [delete_bookmark] Error: {str(e)}")
-            logger.error(f"Error removing bookmark: {str(e)}")
-            return {
-                'status': 'error',
-                'message': str(e)
-            }, 500
+    Returns:
+        dict: Contains success message.
+        int: HTTP 200 on success, 500 on error.
+    """
+    try:
+        logger.debug("Called for bookmark: %s", bookmark_id)
+        user_id = g.user_id
+        logger.debug("Deleting bookmark %s for user %s", bookmark_id, user_id)
+
+        result = delete_bookmark(user_id, bookmark_id)
+        logger.debug("Deletion result: %s", result)
+
+        return {
+            'status': 'success',
+            'message': 'Bookmark removed successfully'
+        }, 200
+
+    except Exception as e:
+        logger.debug("Error: %s", str(e))
+        logger.error(f"Error removing bookmark: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+# Mount the hot-path blueprint now that its views are defined
+app.register_blueprint(hot)
 
 @story_tracking_ns.route('/')
 class StoryTracking(Resource):
@@ -580,46 +857,63 @@ class StoryTracking(Resource):
             int: HTTP 200 on success, 400 if keyword is missing, 500 on error.
         """
         try:
-            print("[DEBUG] [api_gateway] [story_tracking] Story tracking get endpoint called")
+            logger.debug("Story tracking get endpoint called")
             keyword = request.args.get('keyword')
-            print(f"[DEBUG] [api_gateway] [story_tracking] Requested keyword: '{keyword}'")
+            logger.debug("Requested keyword: '%s'", keyword)
             if not keyword:
-                print("[DEBUG] [api_gateway] [story_tracking] Keyword parameter missing")
-                return make_response(jsonify({
+                logger.debug("Keyword parameter missing")
+                return ojson({
                     'status': 'error',
                     'message': 'Keyword parameter is required'
-                }), 400)
+                }, 400)
 
-            print(f"[DEBUG] [api_gateway] [story_tracking] Fetching news for keyword: '{keyword}'")
-            articles = fetch_news(keyword)
-            print(f"[DEBUG] [api_gateway] [story_tracking] Found {len(articles) if articles else 0} articles")
+            logger.debug("Fetching news for keyword: '%s'", keyword)
+            articles = cached_fetch_news(keyword)
+            logger.debug("Found %s articles", len(articles) if articles else 0)
             
+            # Fan the per-article Supabase inserts out on the shared pool
+            futures = [_io_pool.submit(store_article_in_supabase, article) for article in articles]
+
+            # Opt-in NDJSON streaming: each article is emitted as soon as its
+            # insert completes instead of after the whole batch
+            if request.args.get('stream'):
+                def generate():
+                    for article, future in zip(articles, futures):
+                        yield orjson.dumps({
+                            'id': future.result(),
+                            'title': article.get('title'),
+                            'url': article.get('url'),
+                            'source': article.get('source', {}).get('name') if isinstance(article.get('source'), dict) else article.get('source'),
+                            'publishedAt': article.get('publishedAt', datetime.datetime.now(datetime.timezone.utc).isoformat())
+                        }) + b'\n'
+                return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
             processed_articles = []
-            for article in articles:
-                print(f"[DEBUG] [api_gateway] [story_tracking] Processing article: {article.get('title', 'No title')}")
-                article_id = store_article_in_supabase(article)
-                print(f"[DEBUG] [api_gateway] [story_tracking] Stored article with ID: {article_id}")
+            for article, future in zip(articles, futures):
+                logger.debug("Processing article: %s", article.get('title', 'No title'))
+                article_id = future.result()
+                logger.debug("Stored article with ID: %s", article_id)
                 processed_articles.append({
                     'id': article_id,
                     'title': article.get('title'),
                     'url': article.get('url'),
                     'source': article.get('source', {}).get('name') if isinstance(article.get('source'), dict) else article.get('source'),
-                    'publishedAt': article.get('publishedAt', datetime.now().isoformat())
+                    'publishedAt': article.get('publishedAt', datetime.datetime.now(datetime.timezone.utc).isoformat())
                 })
 
-            print(f"[DEBUG] [api_gateway] [story_tracking] Returning {len(processed_articles)} processed articles")
-            return make_response(jsonify({
+            logger.debug("Returning %s processed articles", len(processed_articles))
+            return ojson({
                 'status': 'success',
                 'articles': processed_articles
-            }), 200)
+            }, 200)
 
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [story_tracking] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error in story tracking: {str(e)}")
-            return make_response(jsonify({
+            return ojson({
                 'status': 'error',
                 'message': str(e)
-            }), 500)
+            }, 500)
     
     @token_required
     def post(self):
@@ -639,46 +933,42 @@ class StoryTracking(Resource):
             int: HTTP 201 on success, 400 on validation error, 500 on server error.
         """
         try:
-            print("[DEBUG] [api_gateway] [story_tracking] Called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [story_tracking] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [story_tracking] Creating tracked story for user: {user_id}")
+            logger.debug("Called")
+            user_id = g.user_id
+            logger.debug("Creating tracked story for user: %s", user_id)
             
             data = request.get_json()
             keyword = data.get('keyword')
             source_article_id = data.get('sourceArticleId')
-            print(f"[DEBUG] [api_gateway] [story_tracking] Story details - Keyword: '{keyword}', Source article: {source_article_id}")
+            logger.debug("Story details - Keyword: '%s', Source article: %s", keyword, source_article_id)
             
             if not keyword:
-                print("[DEBUG] [api_gateway] [story_tracking] Keyword parameter missing in request")
-                return make_response(jsonify({
+                logger.debug("Keyword parameter missing in request")
+                return ojson({
                     'status': 'error',
                     'message': 'Keyword is required'
-                }), 400)
+                }, 400)
             
-            print(f"[DEBUG] [api_gateway] [story_tracking] Calling create_tracked_story with user_id: {user_id}, keyword: '{keyword}'")
+            logger.debug("Calling create_tracked_story with user_id: %s, keyword: '%s'", user_id, keyword)
             tracked_story = create_tracked_story(user_id, keyword, source_article_id)
-            print(f"[DEBUG] [api_gateway] [story_tracking] Tracked story created with ID: {tracked_story['id'] if tracked_story else 'unknown'}")
+            logger.debug("Tracked story created with ID: %s", tracked_story['id'] if tracked_story else 'unknown')
             
-            print(f"[DEBUG] [api_gateway] [story_tracking] Getting full story details for story: {tracked_story['id']}")
+            logger.debug("Getting full story details for story: %s", tracked_story['id'])
             story_with_articles = get_story_details(tracked_story['id'])
-            print(f"[DEBUG] [api_gateway] [story_tracking] Found {len(story_with_articles.get('articles', [])) if story_with_articles else 0} related articles")
+            logger.debug("Found %s related articles", len(story_with_articles.get('articles', [])) if story_with_articles else 0)
             
-            return make_response(jsonify({
+            return ojson({
                 'status': 'success',
                 'data': story_with_articles
-            }), 201)
+            }, 201)
             
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [story_tracking] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error creating tracked story: {str(e)}")
-            return make_response(jsonify({
+            return ojson({
                 'status': 'error',
                 'message': str(e)
-            }), 500)
+            }, 500)
 
 @story_tracking_ns.route('/user')
 class UserStoryTracking(Resource):
@@ -694,30 +984,26 @@ class UserStoryTracking(Resource):
             int: HTTP 200 on success, 500 on error.
         """
         try:
-            print("[DEBUG] [api_gateway] [user_story_tracking] Called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [user_story_tracking] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [user_story_tracking] Getting tracked stories for user: {user_id}")
+            logger.debug("Called")
+            user_id = g.user_id
+            logger.debug("Getting tracked stories for user: %s", user_id)
             
-            print(f"[DEBUG] [api_gateway] [user_story_tracking] Calling get_tracked_stories")
+            logger.debug("Calling get_tracked_stories", )
             tracked_stories = get_tracked_stories(user_id)
-            print(f"[DEBUG] [api_gateway] [user_story_tracking] Found {len(tracked_stories)} tracked stories")
-            
-            return make_response(jsonify({
+            logger.debug("Found %s tracked stories", len(tracked_stories))
+
+            return ojson_conditional({
                 'status': 'success',
                 'data': tracked_stories
-            }), 200)
+            })
             
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [user_story_tracking] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error getting tracked stories: {str(e)}")
-            return make_response(jsonify({
+            return ojson({
                 'status': 'error',
                 'message': str(e)
-            }), 500)
+            }, 500)
 
 @story_tracking_ns.route('/<string:story_id>')
 class StoryTrackingDetail(Resource):
@@ -736,31 +1022,31 @@ class StoryTrackingDetail(Resource):
             int: HTTP 200 on success, 404 if story not found, 500 on error.
         """
         try:
-            print(f"[DEBUG] [api_gateway] [story_tracking_detail] Called for story: {story_id}")
-            print(f"[DEBUG] [api_gateway] [story_tracking_detail] Calling get_story_details for story: {story_id}")
+            logger.debug("Called for story: %s", story_id)
+            logger.debug("Calling get_story_details for story: %s", story_id)
             story = get_story_details(story_id)
             
             if not story:
-                print(f"[DEBUG] [api_gateway] [story_tracking_detail] No story found with ID: {story_id}")
-                return make_response(jsonify({
+                logger.debug("No story found with ID: %s", story_id)
+                return ojson({
                     'status': 'error',
                     'message': 'Tracked story not found'
-                }), 404)
+                }, 404)
             
-            print(f"[DEBUG] [api_gateway] [story_tracking_detail] Found story: {story['keyword']}")
-            print(f"[DEBUG] [api_gateway] [story_tracking_detail] Story has {len(story.get('articles', []))} articles")
-            return make_response(jsonify({
+            logger.debug("Found story: %s", story['keyword'])
+            logger.debug("Story has %s articles", len(story.get('articles', [])))
+            return ojson_conditional({
                 'status': 'success',
                 'data': story
-            }), 200)
+            })
             
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [story_tracking_detail] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error getting story details: {str(e)}")
-            return make_response(jsonify({
+            return ojson({
                 'status': 'error',
                 'message': str(e)
-            }), 500)
+            }, 500)
     
     @token_required
     def delete(self, story_id):
@@ -777,38 +1063,34 @@ class StoryTrackingDetail(Resource):
             int: HTTP 200 on success, 404 if story not found, 500 on error.
         """
         try:
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Called for story: {story_id}")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Deleting tracked story {story_id} for user {user_id}")
+            logger.debug("Called for story: %s", story_id)
+            user_id = g.user_id
+            logger.debug("Deleting tracked story %s for user %s", story_id, user_id)
             
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Calling delete_tracked_story")
+            logger.debug("Calling delete_tracked_story", )
             success = delete_tracked_story(user_id, story_id)
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Delete result: {success}")
+            logger.debug("Delete result: %s", success)
             
             if not success:
-                print(f"[DEBUG] [api_gateway] [delete_story_tracking] Failed to delete story or story not found")
-                return make_response(jsonify({
+                logger.debug("Failed to delete story or story not found", )
+                return ojson({
                     'status': 'error',
                     'message': 'Failed to delete tracked story or story not found'
-                }), 404)
+                }, 404)
             
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Story deleted successfully")
-            return make_response(jsonify({
+            logger.debug("Story deleted successfully", )
+            return ojson({
                 'status': 'success',
                 'message': 'Tracked story deleted successfully'
-            }), 200)
+            }, 200)
             
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [delete_story_tracking] Error: {str(e)}")
+            logger.debug("Error: %s", str(e))
             logger.error(f"Error deleting tracked story: {str(e)}")
-            return make_response(jsonify({
+            return ojson({
                 'status': 'error',
                 'message': str(e)
-            }), 500)
+            }, 500)
 
 @app.route('/api/story_tracking', methods=['OPTIONS'])
 def story_tracking_options():
@@ -820,17 +1102,20 @@ def story_tracking_options():
     Returns:
         Response: A Flask response object with appropriate CORS headers.
     """
-    print("[DEBUG] [api_gateway] [story_tracking_options] Called")
+    logger.debug("Called")
     response = make_response()
     response.headers.add("Access-Control-Allow-Origin", "*")
     response.headers.add("Access-Control-Allow-Headers", "Content-Type,Authorization")
     response.headers.add("Access-Control-Allow-Methods", "GET,POST,PUT,DELETE,OPTIONS")
-    print("[DEBUG] [api_gateway] [story_tracking_options] Responding with CORS headers")
+    logger.debug("Responding with CORS headers")
     return response
 
 if __name__ == '__main__':
+    # Local development only — production runs under gunicorn via wsgi.py.
     # Read the port from the environment (Cloud Run sets the PORT variable)
     port = int(os.environ.get("PORT", 8080))
+    # Debug mode (reloader + interactive debugger) is opt-in, never default
+    debug = os.environ.get("FLASK_DEBUG", "0") == "1"
     # Listen on 0.0.0.0 so the service is reachable externally
-    print(f"[DEBUG] [api_gateway] [main] Starting on {Config.API_HOST}:{port} with debug={True}")
-    app.run(host="0.0.0.0", port=port, debug=True)
+    logger.debug("Starting on %s:%s with debug=%s", Config.API_HOST, port, debug)
+    app.run(host="0.0.0.0", port=port, debug=debug)
@@ -0,0 +1,130 @@
+"""Redis-backed read cache for hot service-layer queries.
+
+Wraps a pooled Redis client with a small decorator so frequently polled
+reads (tracked stories, story details) are served from memory instead of
+re-querying Supabase on every request, plus get/put helpers for callers
+that manage their own lookup flow. Values are serialized with orjson.
+
+The cache degrades gracefully: if Redis is unreachable, reads fall through
+to the wrapped function and writes/invalidations are dropped, so a missing
+Redis never takes the API down — it just loses the speedup.
+"""
+
+import functools
+import logging
+
+import orjson
+import redis
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# One connection pool per process; every cached call borrows a connection
+# instead of opening a TCP handshake of its own
+_pool = redis.ConnectionPool(
+    host=Config.REDIS_HOST,
+    port=Config.REDIS_PORT,
+    max_connections=64,
+)
+_client = redis.Redis(connection_pool=_pool)
+
+
+def redis_cache(key_fn, ttl):
+    """Decorator caching a function's JSON-serializable result in Redis.
+
+    Args:
+        key_fn (Callable): Maps the wrapped function's arguments to a cache
+            key string, e.g. ``lambda user_id: f"ts:user:{user_id}"``.
+        ttl (int): Seconds before the cached value expires.
+
+    Returns:
+        Callable: The caching decorator. None results are never cached, so a
+        miss in the underlying store stays a miss.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs)
+            try:
+                cached = _client.get(key)
+            except redis.RedisError as e:
+                logger.debug("Redis unavailable for %s: %s", key, e)
+                return func(*args, **kwargs)
+            if cached is not None:
+                return orjson.loads(cached)
+            result = func(*args, **kwargs)
+            if result is not None:
+                try:
+                    _client.setex(key, ttl, orjson.dumps(result))
+                except (redis.RedisError, TypeError) as e:
+                    logger.debug("Skipping cache write for %s: %s", key, e)
+            return result
+        return wrapper
+    return decorator
+
+
+def get(key):
+    """Best-effort read of a cached value.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        The deserialized value, or None on a miss or if Redis is down.
+    """
+    try:
+        cached = _client.get(key)
+    except redis.RedisError as e:
+        logger.debug("Redis unavailable for %s: %s", key, e)
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+def put(key, value, ttl):
+    """Best-effort write of a JSON-serializable value.
+
+    Args:
+        key (str): The cache key.
+        value: The value to cache.
+        ttl (int): Seconds before the cached value expires.
+    """
+    try:
+        _client.setex(key, ttl, orjson.dumps(value))
+    except (redis.RedisError, TypeError) as e:
+        logger.debug("Skipping cache write for %s: %s", key, e)
+
+
+def put_many(items, ttl):
+    """Best-effort write of several values in one round trip.
+
+    A non-transactional pipeline sends every SETEX in a single network
+    exchange, so caching a batch costs one RTT instead of one per key.
+
+    Args:
+        items (dict): Mapping of cache key to JSON-serializable value.
+        ttl (int): Seconds before the cached values expire.
+    """
+    if not items:
+        return
+    try:
+        pipe = _client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(key, ttl, orjson.dumps(value))
+        pipe.execute()
+    except (redis.RedisError, TypeError) as e:
+        logger.debug("Skipping bulk cache write of %s keys: %s", len(items), e)
+
+
+def invalidate(*keys):
+    """Best-effort delete of cache keys after a write to the backing store.
+
+    Args:
+        *keys (str): The cache keys to drop.
+    """
+    if not keys:
+        return
+    try:
+        _client.delete(*keys)
+    except redis.RedisError as e:
+        logger.debug("Redis unavailable for invalidation of %s: %s", keys, e)
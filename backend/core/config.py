@@ -24,12 +24,20 @@ class Config:
     # API Keys
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+
+    # Summarization Configuration
+    # ~150-word summaries of news articles are a lightweight task; default
+    # to the cheapest acceptable tier and let operators route to a bigger
+    # model without a code change
+    SUMMARIZER_MODEL = os.getenv('SUMMARIZER_MODEL', 'gpt-4o-mini')
     
 
-    # CORS Configuration
-    CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
-    print("CORS_ORIGINS", CORS_ORIGINS)
+    # CORS Configuration — parsed once at class definition; a tuple so no
+    # caller can mutate the shared value
+    CORS_ORIGINS = tuple(os.getenv('CORS_ORIGINS', '*').split(','))
     # Logging Configuration
+    # Default INFO keeps the per-request debug logging free in production;
+    # set LOG_LEVEL=DEBUG in the environment when investigating
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
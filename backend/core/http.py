@@ -0,0 +1,29 @@
+"""Shared outbound HTTP session with connection pooling and retries.
+
+Every per-call requests.get() opens a fresh TCP+TLS connection — a fixed
+30-100ms tax on each outbound request. This module holds one process-wide
+requests.Session whose adapter keeps connections alive and reuses them, and
+retries transient upstream failures with a short backoff. Import ``session``
+instead of calling module-level requests functions.
+
+(Supabase traffic is not routed through here: its client library manages its
+own pooled httpx connections.)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+    ),
+)
+
+session = requests.Session()
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
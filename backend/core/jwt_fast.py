@@ -0,0 +1,87 @@
+"""Specialized HS256 JWT verification for the API Gateway hot path.
+
+The gateway only ever accepts HS256 tokens with a known secret, so the
+general-purpose PyJWT decode path (header-driven algorithm dispatch, options
+dict handling, support for RSA/ECDSA families) is dead weight per request.
+This module does exactly the work the gateway needs and nothing else:
+base64url-decode, one HMAC-SHA256 compare via hmac.compare_digest, JSON-parse
+the payload, then check exp and audience.
+
+Token *issuing* still goes through PyJWT; only verification is specialized.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+
+
+class InvalidTokenError(Exception):
+    """Raised when a token is malformed, tampered with, expired or misaudienced."""
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode a base64url segment, tolerating stripped padding."""
+    padding = -len(data) % 4
+    try:
+        return base64.urlsafe_b64decode(data + '=' * padding)
+    except (binascii.Error, ValueError):
+        raise InvalidTokenError('Invalid base64url encoding')
+
+
+def verify_hs256(token: str, key: bytes, audience: str = None, leeway: int = 0) -> dict:
+    """Verify an HS256 JWT and return its payload.
+
+    Args:
+        token: The raw compact-serialized JWT.
+        key: The HMAC secret as bytes.
+        audience: Expected 'aud' claim. Pass None for tokens issued without
+            an audience; a token that carries one is then rejected.
+        leeway: Seconds of clock skew tolerated when checking 'exp'.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        InvalidTokenError: If the token is malformed, signed with a different
+            algorithm or key, expired, missing 'exp', or has the wrong audience.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split('.')
+    except ValueError:
+        raise InvalidTokenError('Token is not a compact JWT')
+
+    try:
+        header = json.loads(_b64url_decode(header_b64))
+    except ValueError:
+        raise InvalidTokenError('Invalid token header')
+    if header.get('alg') != 'HS256':
+        raise InvalidTokenError('Unsupported algorithm')
+
+    signing_input = (header_b64 + '.' + payload_b64).encode()
+    expected = hmac.new(key, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+        raise InvalidTokenError('Signature verification failed')
+
+    try:
+        payload = json.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        raise InvalidTokenError('Invalid token payload')
+
+    exp = payload.get('exp')
+    if exp is None:
+        raise InvalidTokenError('Token is missing required claim: exp')
+    if exp < time.time() - leeway:
+        raise InvalidTokenError('Token has expired')
+
+    aud = payload.get('aud')
+    if audience is not None:
+        valid = audience in aud if isinstance(aud, list) else aud == audience
+        if not valid:
+            raise InvalidTokenError('Invalid audience')
+    elif aud is not None:
+        raise InvalidTokenError('Unexpected audience claim')
+
+    return payload
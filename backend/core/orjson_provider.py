@@ -0,0 +1,23 @@
+"""Flask JSON provider backed by orjson.
+
+Installed as ``app.json`` so everything that still goes through Flask's own
+JSON machinery — error handlers, request.get_json(), any stray jsonify —
+uses the C encoder instead of the stdlib one. Hot endpoints build responses
+directly via the gateway's ojson() helper; this covers the rest.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that delegates serialization to orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # orjson handles datetimes natively; OPT_NAIVE_UTC serializes any
+        # naive timestamp that slips through (legacy data, third-party
+        # objects) as UTC
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -1,15 +1,50 @@
 import logging
 import logging.config
+import os
+import queue
+import threading
 import traceback
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from typing import Callable, Any
 from .config import Config
 
-# Configure logging based on settings from Config
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format=Config.LOG_FORMAT
-)
+# All handler I/O happens on one background listener thread: request threads
+# only enqueue the LogRecord, so they never block on a stream write/flush or
+# contend for the handler lock. (No logging.basicConfig here — it would
+# install a root stream handler that writes synchronously and duplicates
+# every record the listener already emits.)
+_log_queue = queue.SimpleQueue()
+
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
+
+# Started lazily on the first emit rather than at import: under gunicorn's
+# preload_app this module is imported in the master process, and the listener
+# thread is not inherited by forked workers — their records would queue
+# forever with no consumer. The pid check restarts the listener in whichever
+# process actually logs.
+_listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+def _ensure_listener():
+    """Start the listener thread in the current process if needed."""
+    global _listener_pid
+    pid = os.getpid()
+    if _listener_pid == pid:
+        return
+    with _listener_lock:
+        if _listener_pid != pid:
+            _listener.start()
+            _listener_pid = pid
+
+class _LazyStartQueueHandler(QueueHandler):
+    """QueueHandler that guarantees a listener exists before enqueueing."""
+
+    def emit(self, record):
+        _ensure_listener()
+        super().emit(record)
 
 def get_logger(name: str) -> logging.Logger:
     """Returns a logger instance with the specified name"""
@@ -32,22 +67,27 @@ def log_exception(logger: logging.Logger) -> Callable:
     return decorator
 
 def setup_logger(name: str, log_file: str = None) -> logging.Logger:
-    """Sets up a logger with file and console handlers"""
+    """Sets up a logger whose handler I/O runs on the background listener"""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, Config.LOG_LEVEL))
 
-    # Create formatters and handlers
-    formatter = logging.Formatter(Config.LOG_FORMAT)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler (optional)
+    # The queue handler is the logger's only handler; don't also bubble
+    # records up to the root logger or they'd be emitted twice
+    logger.propagate = False
+
+    # Calling setup_logger twice for the same name must not stack handlers,
+    # or each request log line gets written N times
+    if logger.handlers:
+        return logger
+
+    logger.addHandler(_LazyStartQueueHandler(_log_queue))
+
+    # File handler (optional): attached to the shared listener, filtered to
+    # this logger's records so other loggers don't leak into the file
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
+        file_handler.addFilter(logging.Filter(name))
+        _listener.handlers += (file_handler,)
+
     return logger
\ No newline at end of file
@@ -21,11 +21,19 @@ Typical usage example:
 """
 
 from flask import Flask, request, jsonify
+import bcrypt
+import functools
+import hmac
 import json
-import datetime
+import mmap
 import jwt
+import orjson
 import os
+import queue
+import threading
+import time
 from pathlib import Path
+from cachetools import TTLCache
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # Change this in production
@@ -33,30 +41,65 @@ app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # Cha
 # Get the path to the users file
 USERS_FILE = Path(__file__).parent.parent / 'data' / 'users.txt'
 
-# Ensure the data directory exists
-USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-# Create users.txt if it doesn't exist
-if not USERS_FILE.exists():
-    with open(USERS_FILE, 'w') as f:
-        json.dump([
-            {
-                "id": 1,
-                "username": "testuser",
-                "password": "password123",
-                "email": "test@example.com",
-                "firstName": "Test",
-                "lastName": "User"
-            }
-        ], f)
+@functools.lru_cache(maxsize=1)
+def _ensure_users_file():
+    """Create the data directory and seed users.txt if it doesn't exist.
+
+    Runs on first read rather than at import, so importing this module does
+    no filesystem I/O — gunicorn worker forks and test imports pay zero
+    mkdir/stat/write syscalls. The lru_cache guard makes every call after
+    the first a cache hit, so repeat reads skip the mkdir/exists syscalls
+    too.
+    """
+    USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if not USERS_FILE.exists():
+        with open(USERS_FILE, 'w') as f:
+            json.dump([
+                {
+                    "id": 1,
+                    "username": "testuser",
+                    "password": "password123",
+                    "email": "test@example.com",
+                    "firstName": "Test",
+                    "lastName": "User"
+                }
+            ], f)
+
+def _read_users_file():
+    """Read and JSON-parse users.txt from disk.
+
+    Returns:
+        list: The raw list of user records, or an empty list on error.
+    """
+    try:
+        _ensure_users_file()
+        # Small files: one contiguous bytes read parsed by orjson's C
+        # scanner. Once the file outgrows a few pages, map it instead so
+        # orjson parses straight from the page cache with no read() copy
+        # into a fresh bytes object.
+        if USERS_FILE.stat().st_size < 16384:
+            return orjson.loads(USERS_FILE.read_bytes())
+        with open(USERS_FILE, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # memoryview: orjson takes buffer-protocol objects but not
+                # mmap itself; the view adds no copy
+                return orjson.loads(memoryview(mm))
+            finally:
+                mm.close()
+    except Exception as e:
+        print(f"Error loading users: {e}")
+        return []
 
 def load_users():
     """Load user data from the users.txt file.
-    
-    This function reads the JSON-formatted user data from the users.txt file
-    and returns it as a Python list of dictionaries. Each dictionary contains
+
+    This function returns the JSON-formatted user data from the users.txt file
+    as a Python list of dictionaries. Each dictionary contains
     user information including id, username, password, email, and name.
-    
+    The list is served from an in-memory cache and only re-read from disk
+    when the file's mtime changes, so repeated calls cost one os.stat.
+
     Returns:
         list: A list of dictionaries containing user data.
               Each dictionary has the following structure:
@@ -72,9 +115,180 @@ def load_users():
     Raises:
         Exception: If there's an error reading or parsing the users file.
     """
+    return _refresh_users_index()['users']
+
+# In-memory cache and index over the users file so auth lookups are O(1) dict
+# gets instead of a disk read + JSON parse + linear scan per request. Both are
+# rebuilt only when the file's mtime changes (e.g. after a signup writes it).
+_users_index = {'mtime': 0.0, 'users': [], 'by_id': {}, 'by_username': {}}
+_users_index_lock = threading.Lock()
+
+def _refresh_users_index():
+    """Rebuild the user cache and index if users.txt changed since last read."""
+    # Seed before the stat, not inside the read: a missing file would stat to
+    # the same 0.0 the cache initializes with, so the "changed" check would
+    # never fire and the seed path would be unreachable. The lru_cache guard
+    # makes every call after the first free.
+    _ensure_users_file()
     try:
-        with open(USERS_FILE, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error loading users: {e}")
-        return []
+        mtime = os.stat(USERS_FILE).st_mtime
+    except OSError:
+        mtime = 0.0
+    with _users_index_lock:
+        if mtime != _users_index['mtime']:
+            users = _read_users_file()
+            _users_index['mtime'] = mtime
+            _users_index['users'] = users
+            _users_index['by_id'] = {u.get('id'): u for u in users}
+            _users_index['by_username'] = {u.get('username'): u for u in users}
+        return _users_index
+
+def get_user_by_username(username):
+    """Look up a user record by username via the in-memory index.
+
+    Args:
+        username (str): The username to look up.
+
+    Returns:
+        dict or None: The user record, or None if no such user exists.
+    """
+    return _refresh_users_index()['by_username'].get(username)
+
+# Short-TTL cache of verified token payloads: bearers are reused for the whole
+# token lifetime, so repeat requests skip the HMAC verification and payload
+# parse. Failed validations are never cached, and cached payloads are
+# re-checked against 'exp' so an expired token never authenticates.
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+def decode_token(token):
+    """Decode and verify a JWT, serving repeat verifications from a TTL cache.
+
+    Args:
+        token (str): The raw JWT from the Authorization header.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or expired.
+    """
+    now = time.time()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(token)
+    if payload is not None and payload.get('exp', now + 1) > now:
+        return payload
+    payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+    with _jwt_cache_lock:
+        _jwt_cache[token] = payload
+    return payload
+
+def verify_credentials(username, password):
+    """Authenticate a username/password pair with an O(1) index lookup.
+
+    Replaces the linear scan over load_users() with a single dict get, and
+    compares passwords in constant time: bcrypt for hashed records, and
+    hmac.compare_digest for legacy plaintext ones.
+
+    Args:
+        username (str): The username to authenticate.
+        password (str): The plaintext password to check.
+
+    Returns:
+        dict or None: The user record on success, None on unknown user or
+        wrong password.
+    """
+    user = _refresh_users_index()['by_username'].get(username)
+    if user is None:
+        return None
+    hashed = user.get('password_hash')
+    if hashed is not None:
+        return user if bcrypt.checkpw(password.encode(), hashed.encode()) else None
+    # Compare as bytes: compare_digest only takes str when both sides are
+    # ASCII, so a non-ASCII attempt would raise instead of returning None
+    if hmac.compare_digest(user.get('password', '').encode(), password.encode()):
+        return user
+    return None
+
+# Signups enqueue here and a single background thread persists the user list,
+# so callers never block on disk I/O and concurrent signups cannot clobber
+# each other's writes.
+_user_write_queue = queue.Queue()
+
+def _user_writer_loop():
+    """Drain pending signups and persist the user list with an atomic rename.
+
+    Runs in a daemon thread. Each wakeup coalesces every queued signup into a
+    single write of the full list: the file is written to a temp path first
+    and swapped in with os.replace so readers never observe a torn file.
+    """
+    while True:
+        _user_write_queue.get()
+        # Coalesce any further pending signups into the same write
+        try:
+            while True:
+                _user_write_queue.get_nowait()
+        except queue.Empty:
+            pass
+        with _users_index_lock:
+            users = list(_users_index['users'])
+        tmp_path = str(USERS_FILE) + '.tmp'
+        try:
+            # Serialize to one compact bytes buffer and write it in a single
+            # call — no pretty-printing (inflates every subsequent parse) and
+            # no chunked streaming through a text-mode handle
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(users))
+            os.replace(tmp_path, USERS_FILE)
+            # Record the new mtime so the next lookup doesn't re-parse the
+            # file we just wrote from our own index.
+            with _users_index_lock:
+                _users_index['mtime'] = os.stat(USERS_FILE).st_mtime
+        except Exception as e:
+            print(f"Error persisting users file: {e}")
+
+# Started lazily on the first enqueue rather than at import: under gunicorn's
+# preload_app this module is imported in the master process, and a thread
+# started there is not inherited by forked workers — the queue would have no
+# consumer in the processes that actually serve signups.
+_user_writer = None
+_user_writer_lock = threading.Lock()
+
+def _ensure_user_writer():
+    """Start the user-persistence thread in the current process if needed."""
+    global _user_writer
+    if _user_writer is not None and _user_writer.is_alive():
+        return
+    with _user_writer_lock:
+        if _user_writer is None or not _user_writer.is_alive():
+            _user_writer = threading.Thread(target=_user_writer_loop, daemon=True)
+            _user_writer.start()
+
+def add_user(new_user):
+    """Register a new user in the index and queue it for persistence.
+
+    The record is visible to lookups immediately; the background writer
+    persists the full list asynchronously, so the caller never waits on
+    disk I/O.
+
+    Args:
+        new_user (dict): The complete user record to add.
+    """
+    index = _refresh_users_index()
+    with _users_index_lock:
+        index['users'].append(new_user)
+        index['by_id'][new_user['id']] = new_user
+        index['by_username'][new_user['username']] = new_user
+    _ensure_user_writer()
+    _user_write_queue.put(new_user)
+
+def get_user_by_id(user_id):
+    """Look up a user record by id via the in-memory index.
+
+    Args:
+        user_id: The user id to look up.
+
+    Returns:
+        dict or None: The user record, or None if no such user exists.
+    """
+    return _refresh_users_index()['by_id'].get(user_id)
@@ -5,6 +5,8 @@ Handles incoming data from scrapers, APIs, and RSS feeds,
 and passes them to the processing layer.
 """
 
+import re
+
 from flask import Flask, jsonify, request
 
 app = Flask(__name__)
@@ -13,12 +15,28 @@ app = Flask(__name__)
 articles = {}
 current_id = 1
 
+# Inverted token index over title+content, maintained at insert time so
+# search is a posting-set intersection instead of a full corpus scan
+_TOKEN_RE = re.compile(r'\w+')
+index = {}
+
+# Lowercased shadow copy of each article's searchable text, computed once at
+# insert so substring checks never re-run str.lower over the corpus
+_lower_text = {}
+
 @app.route('/api/news', methods=['GET', 'POST'])
 def news():
     global current_id
     if request.method == 'POST':
         data = request.get_json()
         articles[current_id] = data
+        # Tokenize and lowercase once here, at insert time, instead of on
+        # every article on every search request
+        title_lower = data.get('title', '').lower()
+        content_lower = data.get('content', '').lower()
+        _lower_text[current_id] = (title_lower, content_lower)
+        for token in set(_TOKEN_RE.findall(title_lower + ' ' + content_lower)):
+            index.setdefault(token, set()).add(current_id)
         response = {'id': current_id, 'message': 'Article created'}
         current_id += 1
         return jsonify(response), 201
@@ -35,11 +53,35 @@ def news_by_id(article_id):
 @app.route('/api/news/search', methods=['GET'])
 def search():
     query = request.args.get('q', '').lower()
+    if not query:
+        # An empty query matched every article before; keep that behavior
+        return jsonify(list(articles.values())), 200
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        # Punctuation-only query: nothing to look up in the token index, so
+        # fall back to the substring scan over the precomputed shadow text
+        results = [
+            articles[article_id] for article_id, (title, content) in sorted(_lower_text.items())
+            if query in title or query in content
+        ]
+        return jsonify(results), 200
+    # Intersect posting sets smallest-first so the working set only shrinks;
+    # a token with no postings means no article can match
+    postings = [index.get(token) for token in tokens]
+    if any(p is None for p in postings):
+        return jsonify([]), 200
+    postings.sort(key=len)
+    candidates = postings[0].intersection(*postings[1:])
+    # Substring-verify only the surviving candidates against the precomputed
+    # lowercase shadow text — no str.lower at query time
     results = [
-        article for article in articles.values()
-        if query in article.get('title', '').lower() or query in article.get('content', '').lower()
+        articles[article_id] for article_id in sorted(candidates)
+        if query in _lower_text[article_id][0] or query in _lower_text[article_id][1]
     ]
     return jsonify(results), 200
 
 if __name__ == '__main__':
+    # Local development only; production serves this app with
+    # `gunicorn -c gunicorn.conf.py backend.microservices.ingestion_service:app`
+    # so concurrent requests overlap instead of queuing behind the dev server.
     app.run(host='0.0.0.0', port=5002)
@@ -18,10 +18,15 @@ Environment Variables Required:
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from cachetools import TTLCache
 from dotenv import load_dotenv
-import json
+import orjson
 from pathlib import Path
 from backend.core.config import Config
+from backend.core.http import session
 
 # Load environment variables from .env file for configuration
 load_dotenv()
@@ -29,18 +34,30 @@ load_dotenv()
 # Initialize the News API key from environment variables
 NEWS_API_KEY = os.getenv('NEWS_API_KEY')
 
-def fetch_news(keyword='', session_id=None):
+# Per-keyword response cache: two users searching the same term seconds apart
+# share one upstream call, saving ~100-500ms of latency and a unit of the News
+# API's daily quota. TTL is env-tunable so operators can trade staleness
+# against upstream load.
+NEWS_CACHE_TTL = int(os.getenv('NEWS_CACHE_TTL', '60'))
+_news_cache = TTLCache(maxsize=1024, ttl=NEWS_CACHE_TTL)
+_news_cache_lock = Lock()
+
+def fetch_news(keyword='', session_id=None, limit=20):
     """Fetch news articles from News API based on a keyword search.
 
     This function queries the News API to retrieve articles matching the provided
     keyword. It supports session-based tracking of requests and can handle empty
-    keyword searches.
+    keyword searches. One full upstream page is fetched and sliced locally, so
+    different limits for the same keyword share a single round trip (and cache
+    entry) instead of paying one request per article.
 
     Args:
         keyword (str, optional): The search term to find relevant articles.
             Defaults to empty string which returns top headlines.
         session_id (str, optional): Unique identifier for the current user session.
             Used for organizing saved articles. Defaults to None.
+        limit (int, optional): Maximum number of articles to return.
+            Defaults to 20.
 
     Returns:
         list: A list of dictionaries containing article data with fields like
@@ -50,17 +67,26 @@ def fetch_news(keyword='', session_id=None):
         requests.exceptions.RequestException: If there's an error communicating
             with the News API.
     """
+    # Serve repeat queries for the same keyword from the TTL cache
+    with _news_cache_lock:
+        cached = _news_cache.get(keyword)
+    if cached is not None:
+        return cached[:limit]
+
     # Configure the News API endpoint and request parameters
     url = "https://newsapi.org/v2/everything"
     params = {
         'q': keyword,  # Search query parameter
         'apiKey': NEWS_API_KEY,
-        'pageSize': 1  # Limit results to 10 articles per request
+        'pageSize': 100  # News API max; callers slice locally via limit
     }
 
     try:
-        # Make a GET request to the News API
-        response = requests.get(url, params=params)
+        # Make a GET request to the News API over the shared pooled session,
+        # reusing its keep-alive connection instead of a fresh TCP+TLS setup.
+        # The (connect, read) timeout bounds a hung upstream instead of
+        # letting the request occupy a worker forever.
+        response = session.get(url, params=params, timeout=(3, 10))
         response.raise_for_status()
 
         # Process the response data
@@ -80,14 +106,45 @@ def fetch_news(keyword='', session_id=None):
                 #     print(f"Title: {article['title']}")
                 #     print(f"Description: {article['description']}")
                 #     print(f"URL: {article['url']}\n")
-            
-            return articles
+
+            if articles:
+                # Cache the full page (empty results aren't cached so
+                # transient misses retry); each caller slices its own limit
+                with _news_cache_lock:
+                    _news_cache[keyword] = articles
+            return articles[:limit]
         else:
             print("Failed to fetch news:", news_data.get('message'))
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching news: {e}")
 
+# Pool for fanning fetches out across keywords; sized for the News API's
+# tolerance, not the caller count
+_fetch_pool = ThreadPoolExecutor(max_workers=8)
+
+def fetch_news_many(keywords, session_id=None):
+    """Fetch news articles for several keywords concurrently.
+
+    Each News API round trip is latency-dominated, so N sequential calls cost
+    N round trips; submitting them to a thread pool over the shared pooled
+    session overlaps the waits into roughly one. (Under the gevent worker the
+    pool threads become greenlets, which suits this I/O-bound fan-out.)
+
+    Args:
+        keywords (list): Search terms to fetch articles for.
+        session_id (str, optional): Session identifier passed through to each
+            fetch_news call. Defaults to None.
+
+    Returns:
+        list: Per-keyword results in input order; each entry is the article
+            list for that keyword, or None if that fetch failed.
+    """
+    if not keywords:
+        return []
+    futures = [_fetch_pool.submit(fetch_news, keyword, session_id) for keyword in keywords]
+    return [future.result() for future in futures]
+
 def write_to_file(articles, session_id=None):
     """Save fetched news articles to a JSON file.
 
@@ -115,9 +172,13 @@ def write_to_file(articles, session_id=None):
     # Construct the full file path using the configured data directory
     file_path = Config.NEWS_DATA_DIR / file_name
     try:
-        # Save the articles as formatted JSON for better readability
-        with open(file_path, 'w') as file:
-            json.dump(articles, file, indent=4)
+        # Save the articles as formatted JSON for better readability; orjson
+        # serializes straight to bytes in C, skipping the str-encode pass.
+        # Write to a temp file and rename so a crash mid-write can never
+        # leave a torn half-JSON file for a concurrent reader.
+        tmp_path = file_path.with_suffix('.tmp')
+        tmp_path.write_bytes(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, file_path)
         print(f"Articles successfully saved to {file_path}")
     except IOError as e:
         print(f"Error writing to file: {e}")
@@ -18,6 +18,9 @@ Environment Variables Required:
 
 import os
 import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
@@ -51,51 +54,193 @@ def store_article_in_supabase(article):
     Returns:
         str: The ID of the article (either existing or newly created)
     """
-    # Check if the article already exists using the URL as unique identifier
-    existing = supabase.table("news_articles").select("*").eq("url", article["url"]).execute()
+    # Check if the article already exists using the URL as unique identifier.
+    # Only the id column comes back — fetching the full row would ship the
+    # whole content field over the wire just to discard it.
+    existing = supabase.table("news_articles").select("id").eq("url", article["url"]).limit(1).execute()
     if existing.data and len(existing.data) > 0:
         # Article already exists; return its id
         return existing.data[0]["id"]
     else:
         # Insert a new article with all available fields
-        result = supabase.table("news_articles").insert({
-            "title": article["title"],
-            "summary": article.get("summary", ""),
-            "content": article.get("content", ""),
-            # Handle source field which can be a dict (from API) or a plain string
-            "source": article["source"]["name"] if isinstance(article.get("source"), dict) else article["source"],
-            "published_at": article["publishedAt"],
-            "url": article["url"],
-            "image": article.get("urlToImage", "")
-        }).execute()
+        result = supabase.table("news_articles").insert(_article_row(article)).execute()
         return result.data[0]["id"]
 
+def _article_row(article):
+    """Map a fetched article dict onto a news_articles row."""
+    return {
+        "title": article["title"],
+        "summary": article.get("summary", ""),
+        "content": article.get("content", ""),
+        # Handle source field which can be a dict (from API) or a plain string
+        "source": article["source"]["name"] if isinstance(article.get("source"), dict) else article["source"],
+        "published_at": article["publishedAt"],
+        "url": article["url"],
+        "image": article.get("urlToImage", "")
+    }
+
+def store_articles_bulk(articles):
+    """
+    Inserts a batch of news articles in a single round-trip and returns their IDs.
+
+    Instead of one existence-check plus insert per article (2N HTTP round-trips),
+    this upserts all rows at once keyed on the unique url column, so articles that
+    already exist keep their row and every article costs a share of one request.
+
+    Args:
+        articles (list): Article dicts in the same shape store_article_in_supabase
+            accepts.
+
+    Returns:
+        list: The article IDs in the same order as the input list.
+    """
+    if not articles:
+        return []
+
+    # Dedupe by URL within the batch: Postgres rejects an upsert that touches
+    # the same row twice in one statement
+    rows_by_url = {}
+    for article in articles:
+        rows_by_url.setdefault(article["url"], _article_row(article))
+
+    result = supabase.table("news_articles") \
+        .upsert(list(rows_by_url.values()), on_conflict="url") \
+        .execute()
+
+    id_by_url = {row["url"]: row["id"] for row in result.data}
+    return [id_by_url[article["url"]] for article in articles]
+
+# Pool for overlapping per-article Supabase round trips; the client's pooled
+# HTTP connections are shared across workers so threads don't re-handshake
+_store_pool = ThreadPoolExecutor(max_workers=8)
+
+def store_articles(articles):
+    """
+    Stores a list of articles concurrently via the per-article path.
+
+    Prefer store_articles_bulk, which lands the whole batch in one upsert.
+    This helper exists for callers that need store_article_in_supabase's
+    exact per-article semantics but shouldn't pay its round trips serially:
+    the blocking Supabase calls release the GIL, so pooled threads overlap
+    their network latency.
+
+    Args:
+        articles (list): Article dicts in the same shape
+            store_article_in_supabase accepts.
+
+    Returns:
+        list: The article IDs in the same order as the input list.
+    """
+    if not articles:
+        return []
+    return list(_store_pool.map(store_article_in_supabase, articles))
+
+def log_user_searches_bulk(user_id, article_ids, session_id):
+    """
+    Logs search events for a batch of articles with a single insert.
+
+    Args:
+        user_id (str): The ID of the user performing the search
+        article_ids (list): IDs of the news articles that were viewed/searched
+        session_id (str): The current session identifier
+
+    Returns:
+        dict or None: The Supabase response object, or None for an empty batch
+    """
+    if not article_ids:
+        return None
+
+    current_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    rows = [{
+        "user_id": user_id,
+        "news_id": news_id,
+        "searched_at": current_time,
+        "session_id": session_id,
+    } for news_id in article_ids]
+    return supabase.table("user_search_history").insert(rows).execute()
+
+# Search-history rows queue here and a daemon thread flushes them in batches:
+# callers pay an O(1) enqueue instead of a Supabase round trip, and up to 256
+# events share one insert. Analytics rows are droppable under extreme
+# backpressure, so the queue is bounded rather than unbounded.
+_search_log_queue = queue.Queue(maxsize=10000)
+
+def _search_log_flusher():
+    """Drain queued search events and insert them in coalesced batches.
+
+    Runs in a daemon thread. The 1-second get timeout means a partial batch
+    never waits longer than a second before flushing.
+    """
+    while True:
+        try:
+            rows = [_search_log_queue.get(timeout=1.0)]
+        except queue.Empty:
+            continue
+        while len(rows) < 256:
+            try:
+                rows.append(_search_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        # One timestamp per batch, not per event: enqueued rows arrive
+        # without searched_at and a whole batch spans under a second anyway
+        batch_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for row in rows:
+            row["searched_at"] = batch_time
+        try:
+            supabase.table("user_search_history").insert(rows).execute()
+        except Exception as e:
+            print(f"Error flushing search history batch: {str(e)}")
+
+# Started lazily on the first enqueue rather than at import: under gunicorn's
+# preload_app this module is imported in the master process, and a thread
+# started there is not inherited by forked workers — the queue would have no
+# consumer in the processes that actually log searches.
+_search_log_thread = None
+_search_log_thread_lock = threading.Lock()
+
+def _ensure_search_log_flusher():
+    """Start the search-history flusher in the current process if needed."""
+    global _search_log_thread
+    if _search_log_thread is not None and _search_log_thread.is_alive():
+        return
+    with _search_log_thread_lock:
+        if _search_log_thread is None or not _search_log_thread.is_alive():
+            _search_log_thread = threading.Thread(target=_search_log_flusher, daemon=True)
+            _search_log_thread.start()
+
 def log_user_search(user_id, news_id, session_id):
     """
-    Logs a search event by inserting a record into the user_search_history join table.
-    
-    This function creates a record of a user viewing or searching for a specific article,
-    which can be used for analytics, personalization, and tracking user activity across sessions.
-    
+    Logs a search event by queueing a record for the user_search_history join table.
+
+    This function records a user viewing or searching for a specific article,
+    which can be used for analytics, personalization, and tracking user activity
+    across sessions. The row is enqueued for the background flusher rather than
+    inserted synchronously, so the caller never waits on the database.
+
     Args:
         user_id (str): The ID of the user performing the search
         news_id (str): The ID of the news article that was viewed/searched
         session_id (str): The current session identifier for tracking user activity
-    
+
     Returns:
-        dict: The Supabase response object containing the result of the insert operation
+        bool: True if the event was queued, False if the queue was full and
+              the event was dropped
     """
-    # Create a timestamp for when the search occurred
-    current_time = datetime.datetime.utcnow().isoformat()
-    
-    # Insert the search record with all required fields
-    result = supabase.table("user_search_history").insert({
+    # No timestamp here: the flusher stamps each batch once, saving a
+    # deprecated utcnow() call and an isoformat() allocation per event
+    row = {
         "user_id": user_id,
         "news_id": news_id,
-        "searched_at": current_time,
         "session_id": session_id,
-    }).execute()
-    return result
+    }
+    try:
+        _ensure_search_log_flusher()
+        _search_log_queue.put_nowait(row)
+        return True
+    except queue.Full:
+        # Shedding analytics beats blocking a user request
+        print("Search history queue full; dropping event")
+        return False
 
 def add_bookmark(user_id, news_id):
     """
@@ -148,25 +293,25 @@ def get_user_bookmarks(user_id):
         Exception: If there's an error during the database operation
     """
     try:
-        # Query user_bookmarks and join with news_articles to get full article details
-        # This uses Supabase's foreign key relationships to perform the join
+        # Query user_bookmarks and join with news_articles to get full article
+        # details. This uses Supabase's foreign key relationships to perform
+        # the join, and a PostgREST alias so the bookmark id already arrives
+        # under its final name.
         result = supabase.table("user_bookmarks") \
             .select(
-                "id,"
+                "bookmark_id:id,"
                 "news_articles(id,title,summary,content,source,published_at,url,image)"
             ) \
             .eq("user_id", user_id) \
             .execute()
-        
-        # Transform the nested result structure to a more friendly format
-        # by flattening the news_articles data and adding the bookmark_id
-        bookmarks = []
-        for item in result.data:
-            article = item["news_articles"]
-            article["bookmark_id"] = item["id"]  # Add bookmark ID to article for reference
-            bookmarks.append(article)
-            
-        return bookmarks
+
+        # Flatten each row in a single dict-unpack expression; fully
+        # server-side flattening would need a PostgREST view (a schema
+        # migration), so this keeps the response shape with one cheap pass
+        return [
+            {**item["news_articles"], "bookmark_id": item["bookmark_id"]}
+            for item in result.data
+        ]
     except Exception as e:
         print(f"Error fetching bookmarks: {str(e)}")
         # Re-raise the exception for proper error handling upstream
@@ -28,197 +28,255 @@ Environment Variables Required:
 
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
 from dotenv import load_dotenv
 # from summarization.story_tracking.story_tracking import cluster_articles
+from backend.core.cache import invalidate, redis_cache
+from backend.core.utils import setup_logger
 from backend.microservices.news_fetcher import fetch_news
+from backend.microservices.news_storage import store_articles_bulk
 
-# Service initialization logging
-print("[DEBUG] [story_tracking_service] [main] Story tracking service starting...")
+# Level-gated logger instead of print: debug lines cost a level check when
+# the level is above DEBUG, and %s-style arguments are never formatted
+# unless a handler wants them. Records drain through the shared queue
+# listener, so the request thread never blocks on stdio.
+logger = setup_logger(__name__)
+
+logger.debug("Story tracking service starting...")
 
 # Load environment variables from .env file
 load_dotenv()
-print("[DEBUG] [story_tracking_service] [main] Environment variables loaded")
+logger.debug("Environment variables loaded")
 
 # Initialize Supabase client with service role key for admin access to bypass RLS
 # RLS (Row Level Security) policies are bypassed when using the service role key
 SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
-print(f"[DEBUG] [story_tracking_service] [main] Supabase URL: {SUPABASE_URL}")
-print(f"[DEBUG] [story_tracking_service] [main] Supabase Key: {SUPABASE_SERVICE_KEY[:5]}..." if SUPABASE_SERVICE_KEY else "[DEBUG] [story_tracking_service] [main] Supabase Key: None")
+logger.debug("Supabase URL: %s", SUPABASE_URL)
+logger.debug("Supabase Key: %s", f"{SUPABASE_SERVICE_KEY[:5]}..." if SUPABASE_SERVICE_KEY else None)
 
 # Create Supabase client for database operations
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 
-print("[DEBUG] [story_tracking_service] [main] Supabase client initialized")
+logger.debug("Supabase client initialized")
 
 def run_story_tracking(article_embeddings):
     """
     Runs the story tracking algorithm on a set of article embeddings to identify story clusters.
-    
+
     This function uses clustering algorithms to group similar articles together based on their
     vector embeddings, helping to identify distinct news stories or topics.
-    
+
     Args:
         article_embeddings: List of vector embeddings for articles. Each embedding should be
                           a numerical vector representing the article's content.
-                          
+
     Returns:
         list: A list of cluster labels indicating which story cluster each article belongs to.
               Empty list is returned if article_embeddings is None or empty.
     """
-    print(f"[DEBUG] [story_tracking_service] [run_story_tracking] Running story tracking with {len(article_embeddings) if article_embeddings else 0} embeddings")
+    logger.debug("Running story tracking with %s embeddings", len(article_embeddings) if article_embeddings else 0)
     labels = cluster_articles(article_embeddings)
-    print(f"[DEBUG] [story_tracking_service] [run_story_tracking] Clustering complete, found {len(labels) if labels else 0} labels")
+    logger.debug("Clustering complete, found %s labels", len(labels) if labels else 0)
     return labels
 
+# Pool for article discovery off the request path: creating a story answers
+# after one INSERT instead of blocking on fetch_news plus per-article stores.
+# A Celery deployment (per the TODO above) would add a broker this stack
+# doesn't run; pooled daemon threads match how the gateway backgrounds its
+# Supabase work. Worker count is env-tunable so operators can trade refresh
+# throughput against upstream rate limits.
+_discovery_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv('STORY_DISCOVERY_WORKERS', '4')))
+
+# Columns story reads actually render. news_articles.content is by far the
+# widest field and nothing in the story views displays it, so the explicit
+# list keeps it off the wire and out of the JSON parse.
+_ARTICLE_LIST_COLUMNS = "id,title,summary,source,published_at,url,image"
+
+def _find_related_articles_background(story_id, keyword, user_id):
+    """Run find_related_articles on the pool, logging instead of raising.
+
+    Invalidates the story's cache keys afterwards so the discovered
+    articles appear on the next poll rather than after the TTL.
+    """
+    try:
+        added = find_related_articles(story_id, keyword)
+        if added:
+            invalidate(f"ts:user:{user_id}", f"ts:story:{story_id}")
+    except Exception as e:
+        logger.error("Background discovery failed for story %s: %s", story_id, e)
+
 def create_tracked_story(user_id, keyword, source_article_id=None):
     """
     Creates a new tracked story for a user based on a keyword.
-    
+
     Args:
         user_id: The ID of the user tracking the story
         keyword: The keyword/topic to track
         source_article_id: Optional ID of the source article that initiated tracking
-        
+
     Returns:
         The created tracked story record
     """
-    
-    print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Creating tracked story for user {user_id}, keyword: '{keyword}', source_article: {source_article_id}")
+
+    logger.debug("Creating tracked story for user %s, keyword: '%s', source_article: %s", user_id, keyword, source_article_id)
     try:
-        # Check if the user is already tracking this keyword
-        print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Checking if user already tracks keyword '{keyword}'")
+        # Check if the user is already tracking this keyword. A true
+        # single-round-trip upsert needs a UNIQUE(user_id, keyword) index,
+        # which is a Supabase schema migration this repo can't ship; the
+        # probe at least stops at the first match.
         existing = supabase.table("tracked_stories") \
             .select("*") \
             .eq("user_id", user_id) \
             .eq("keyword", keyword) \
+            .limit(1) \
             .execute()
-            
+
         if existing.data and len(existing.data) > 0:
             # User is already tracking this keyword
-            print(f"[DEBUG] [story_tracking_service] [create_tracked_story] User already tracking this keyword, found {len(existing.data)} existing entries")
+            logger.debug("User %s already tracking keyword '%s'", user_id, keyword)
             return existing.data[0]
-        
-        # Create a new tracked story
-        print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Creating new tracked story record")
-        current_time = datetime.datetime.utcnow().isoformat()
+
+        # Create a new tracked story; one timestamp serves every field below
+        current_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
         result = supabase.table("tracked_stories").insert({
             "user_id": user_id,
             "keyword": keyword,
             "created_at": current_time,
             "last_updated": current_time
         }).execute()
-        
+
         if not result.data:
-            print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Failed to create tracked story: {result}")
+            logger.error("Failed to create tracked story: %s", result)
             return None
-            
+
         tracked_story = result.data[0] if result.data else None
-        print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Tracked story created with ID: {tracked_story['id'] if tracked_story else None}")
-        
+        logger.debug("Tracked story created with ID: %s", tracked_story['id'] if tracked_story else None)
+
         # If a source article was provided, link it to the tracked story
         if tracked_story and source_article_id:
-            print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Linking source article {source_article_id} to tracked story")
             supabase.table("tracked_story_articles").insert({
                 "tracked_story_id": tracked_story["id"],
                 "news_id": source_article_id,
-                "added_at": datetime.datetime.utcnow().isoformat()
+                "added_at": current_time
             }).execute()
-        
-        # Log that we're skipping synchronous article fetching
-        print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Skipping synchronous article fetching to avoid resource contention")
-        find_related_articles(tracked_story["id"], keyword)
-        
+
+        # Hand article discovery to the background pool; the response returns
+        # after the inserts above instead of waiting out fetch_news and the
+        # per-article stores
+        _discovery_pool.submit(_find_related_articles_background, tracked_story["id"], keyword, user_id)
+
+        # Drop the user's cached story list so the new story shows up on the
+        # next poll instead of after the TTL
+        invalidate(f"ts:user:{user_id}")
+
         return tracked_story
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [create_tracked_story] Error creating tracked story: {str(e)}")
+        logger.error("Error creating tracked story: %s", e)
         raise e
 
+@redis_cache(key_fn=lambda user_id: f"ts:user:{user_id}", ttl=60)
 def get_tracked_stories(user_id):
     """
     Gets all tracked stories for a user.
-    
+
+    Served from Redis for up to 60 seconds between rebuilds, so dashboard
+    polling doesn't re-run the Supabase queries on every request.
+
     Args:
         user_id: The ID of the user
-        
+
     Returns:
         List of tracked stories with their related articles
     """
-    print(f"[DEBUG] [story_tracking_service] [get_tracked_stories] Getting tracked stories for user {user_id}")
+    logger.debug("Getting tracked stories for user %s", user_id)
     try:
-        # Get all tracked stories for the user
+        # One embedded PostgREST query fetches every story with its linked
+        # articles — 1 HTTP round trip instead of 1 + M + M*N. The embedded
+        # article columns are listed explicitly: the story list renders
+        # titles and summaries, so shipping every article's full content
+        # would dominate the payload just to be discarded.
         result = supabase.table("tracked_stories") \
-            .select("*") \
+            .select("*, tracked_story_articles(added_at, news_articles(" + _ARTICLE_LIST_COLUMNS + "))") \
             .eq("user_id", user_id) \
             .order("created_at", desc=True) \
             .execute()
-        
+
         tracked_stories = result.data if result.data else []
-        print(f"[DEBUG] [story_tracking_service] [get_tracked_stories] Found {len(tracked_stories)} tracked stories")
-        
-        # For each tracked story, get its related articles
+        logger.debug("Found %s tracked stories", len(tracked_stories))
+
+        # Flatten the embedded rows into each story's articles list, newest
+        # first, matching the shape get_story_articles produces
         for story in tracked_stories:
-            print(f"[DEBUG] [story_tracking_service] [get_tracked_stories] Getting articles for story {story['id']}")
-            story["articles"] = get_story_articles(story["id"])
-            print(f"[DEBUG] [story_tracking_service] [get_tracked_stories] Found {len(story['articles'])} articles for story {story['id']}")
-        
+            articles = []
+            for link in story.pop("tracked_story_articles", None) or []:
+                article = link.get("news_articles")
+                if article is not None:
+                    article["added_at"] = link["added_at"]
+                    articles.append(article)
+            articles.sort(key=lambda a: a["added_at"], reverse=True)
+            story["articles"] = articles
+
         return tracked_stories
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [get_tracked_stories] Error getting tracked stories: {str(e)}")
+        logger.error("Error getting tracked stories: %s", e)
         raise e
 
+@redis_cache(key_fn=lambda story_id: f"ts:story:{story_id}", ttl=300)
 def get_story_details(story_id):
     """
     Gets details for a specific tracked story including related articles.
-    
+
+    Cached in Redis for 5 minutes; the delete path invalidates the key so
+    a removed story doesn't linger.
+
     Args:
         story_id: The ID of the tracked story
-        
+
     Returns:
         The tracked story with its related articles
     """
-    print(f"[DEBUG] [story_tracking_service] [get_story_details] Getting story details for story ID {story_id}")
+    logger.debug("Getting story details for story ID %s", story_id)
     try:
         # Get the tracked story
         result = supabase.table("tracked_stories") \
             .select("*") \
             .eq("id", story_id) \
             .execute()
-        
+
         if not result.data or len(result.data) == 0:
-            print(f"[DEBUG] [story_tracking_service] [get_story_details] No story found with ID {story_id}")
+            logger.debug("No story found with ID %s", story_id)
             return None
-        
+
         story = result.data[0]
-        print(f"[DEBUG] [story_tracking_service] [get_story_details] Found story: {story['keyword']}")
-        
+
         # Get related articles
-        print(f"[DEBUG] [story_tracking_service] [get_story_details] Getting related articles")
         story["articles"] = get_story_articles(story_id)
-        print(f"[DEBUG] [story_tracking_service] [get_story_details] Found {len(story['articles'])} related articles")
-        
+        logger.debug("Found story '%s' with %s related articles", story["keyword"], len(story["articles"]))
+
         return story
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [get_story_details] Error getting story details: {str(e)}")
+        logger.error("Error getting story details: %s", e)
         raise e
 
 def delete_tracked_story(user_id, story_id):
     """
     Deletes a tracked story for a user.
-    
+
     Args:
         user_id: The ID of the user
         story_id: The ID of the tracked story to delete
-        
+
     Returns:
         True if successful, False otherwise
     """
-    print(f"[DEBUG] [story_tracking_service] [delete_tracked_story] Deleting tracked story {story_id} for user {user_id}")
+    logger.debug("Deleting tracked story %s for user %s", story_id, user_id)
     try:
         # Delete the tracked story (related articles will be deleted via CASCADE)
         result = supabase.table("tracked_stories") \
@@ -226,26 +284,29 @@ def delete_tracked_story(user_id, story_id):
             .eq("id", story_id) \
             .eq("user_id", user_id) \
             .execute()
-        
+
         success = len(result.data) > 0
-        print(f"[DEBUG] [story_tracking_service] [delete_tracked_story] Delete operation {'successful' if success else 'failed'}")
+        if success:
+            # Evict both the story itself and the user's story list so
+            # neither read serves the deleted story from cache
+            invalidate(f"ts:user:{user_id}", f"ts:story:{story_id}")
         return success
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [delete_tracked_story] Error deleting tracked story: {str(e)}")
+        logger.error("Error deleting tracked story: %s", e)
         raise e
 
 def get_story_articles(story_id):
     """
     Gets all articles related to a tracked story.
-    
+
     Args:
         story_id: The ID of the tracked story
-        
+
     Returns:
         List of articles related to the tracked story
     """
-    print(f"[DEBUG] [story_tracking_service] [get_story_articles] Getting articles for story {story_id}")
+    logger.debug("Getting articles for story %s", story_id)
     try:
         # Get all article IDs related to the tracked story
         result = supabase.table("tracked_story_articles") \
@@ -253,173 +314,180 @@ def get_story_articles(story_id):
             .eq("tracked_story_id", story_id) \
             .order("added_at", desc=True) \
             .execute()
-        
+
         article_refs = result.data if result.data else []
-        print(f"[DEBUG] [story_tracking_service] [get_story_articles] Found {len(article_refs)} article references")
-        
+
         if not article_refs:
             return []
-        
-        # Get the full article details for each article ID
+
+        # Fetch every referenced article in one IN query instead of one
+        # round trip per reference, then join added_at back in Python
+        ids = [ref["news_id"] for ref in article_refs]
+        rows = supabase.table("news_articles") \
+            .select(_ARTICLE_LIST_COLUMNS) \
+            .in_("id", ids) \
+            .execute()
+        by_id = {row["id"]: row for row in (rows.data or [])}
+
+        # Preserve the added_at ordering from the reference query
         articles = []
         for ref in article_refs:
-            print(f"[DEBUG] [story_tracking_service] [get_story_articles] Getting details for article {ref['news_id']}")
-            article_result = supabase.table("news_articles") \
-                .select("*") \
-                .eq("id", ref["news_id"]) \
-                .execute()
-            
-            if article_result.data and len(article_result.data) > 0:
-                article = article_result.data[0]
-                # Add the added_at timestamp from the join table
+            article = by_id.get(ref["news_id"])
+            if article is not None:
                 article["added_at"] = ref["added_at"]
                 articles.append(article)
-                print(f"[DEBUG] [story_tracking_service] [get_story_articles] Added article: {article.get('title', 'No title')}")
-            else:
-                print(f"[DEBUG] [story_tracking_service] [get_story_articles] No data found for article {ref['news_id']}")
-        
+
+        logger.debug("Returning %s articles for story %s", len(articles), story_id)
         return articles
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [get_story_articles] Error getting story articles: {str(e)}")
+        logger.error("Error getting story articles: %s", e)
         raise e
 
-def find_related_articles(story_id, keyword):
+def find_related_articles(story_id, keyword, existing_ids=None):
     """
     Finds and adds articles related to a tracked story based on its keyword.
-    
+
     Args:
         story_id: The ID of the tracked story
         keyword: The keyword to search for
-        
+        existing_ids: Optional set of news_ids already linked to the story.
+            When the caller has these on hand (the background sweep preloads
+            every story's links in one query), passing them skips the
+            per-story lookup round trip.
+
     Returns:
         Number of new articles added
     """
-    print(f"[DEBUG] [story_tracking_service] [find_related_articles] Finding related articles for story {story_id}, keyword: '{keyword}'")
+    logger.debug("Finding related articles for story %s, keyword: '%s'", story_id, keyword)
     try:
-        # Get the tracked story to check when it was last updated
+        # Existence check only — just the id, not the whole row
         story_result = supabase.table("tracked_stories") \
-            .select("*") \
+            .select("id") \
             .eq("id", story_id) \
+            .limit(1) \
             .execute()
-        
+
         if not story_result.data or len(story_result.data) == 0:
-            print(f"[DEBUG] [story_tracking_service] [find_related_articles] No story found with ID {story_id}")
+            logger.debug("No story found with ID %s", story_id)
             return 0
-        
-        story = story_result.data[0]
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Found story: {story['keyword']}")
-        
+
         # Fetch articles related to the keyword
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Fetching articles for keyword '{keyword}'")
         articles = fetch_news(keyword)
-        
+
         if not articles:
-            print(f"[DEBUG] [story_tracking_service] [find_related_articles] No articles found for keyword '{keyword}'")
+            logger.debug("No articles found for keyword '%s'", keyword)
             return 0
-        
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Found {len(articles)} articles for keyword '{keyword}'")
-        
-        # Get existing article IDs for this story to avoid duplicates
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Getting existing article IDs for story {story_id}")
-        existing_result = supabase.table("tracked_story_articles") \
-            .select("news_id") \
-            .eq("tracked_story_id", story_id) \
-            .execute()
-        
-        existing_ids = [item["news_id"] for item in existing_result.data] if existing_result.data else []
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Found {len(existing_ids)} existing article IDs")
-        
-        # Process and add new articles
-        new_articles_count = 0
-        for article in articles:
-            # First, store the article in the news_articles table
-            print(f"[DEBUG] [story_tracking_service] [find_related_articles] Storing article: {article.get('title', 'No title')}")
-            from backend.microservices.news_storage import store_article_in_supabase
-            article_id = store_article_in_supabase(article)
-            print(f"[DEBUG] [story_tracking_service] [find_related_articles] Article stored with ID: {article_id}")
-            
-            # If this article is not already linked to the story, add it
-            if article_id not in existing_ids:
-                print(f"[DEBUG] [story_tracking_service] [find_related_articles] Linking new article {article_id} to story {story_id}")
-                supabase.table("tracked_story_articles").insert({
-                    "tracked_story_id": story_id,
-                    "news_id": article_id,
-                    "added_at": datetime.datetime.utcnow().isoformat()
-                }).execute()
-                new_articles_count += 1
-            else:
-                print(f"[DEBUG] [story_tracking_service] [find_related_articles] Article {article_id} already linked to story")
-        
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Added {new_articles_count} new articles to story {story_id}")
-        
+
+        # Get existing article IDs for this story to avoid duplicates, unless
+        # the caller already preloaded them
+        if existing_ids is None:
+            existing_result = supabase.table("tracked_story_articles") \
+                .select("news_id") \
+                .eq("tracked_story_id", story_id) \
+                .execute()
+
+            # A set makes the membership tests below O(1) instead of list scans
+            existing_ids = {item["news_id"] for item in existing_result.data} if existing_result.data else set()
+
+        # One bulk upsert stores the whole fetch, then one insert links every
+        # new article — two round trips total instead of two per article
+        article_ids = store_articles_bulk(articles)
+        current_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        new_rows = [{
+            "tracked_story_id": story_id,
+            "news_id": article_id,
+            "added_at": current_time
+        } for article_id in dict.fromkeys(article_ids) if article_id not in existing_ids]
+
+        if new_rows:
+            supabase.table("tracked_story_articles").insert(new_rows).execute()
+
+        new_articles_count = len(new_rows)
+        logger.debug("Added %s new articles to story %s", new_articles_count, story_id)
+
         # Update the last_updated timestamp of the tracked story
         if new_articles_count > 0:
-            print(f"[DEBUG] [story_tracking_service] [find_related_articles] Updating last_updated timestamp for story {story_id}")
             supabase.table("tracked_stories") \
-                .update({"last_updated": datetime.datetime.utcnow().isoformat()}) \
+                .update({"last_updated": current_time}) \
                 .eq("id", story_id) \
                 .execute()
-        
+
         return new_articles_count
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [find_related_articles] Error finding related articles: {str(e)}")
+        logger.error("Error finding related articles: %s", e)
         raise e
 
 def update_all_tracked_stories():
     """
     Background job to update all tracked stories with new related articles.
-    
+
     This function is designed to be run as a scheduled task to keep all tracked stories
     up-to-date with the latest news articles. It iterates through all tracked stories in the
     database and calls find_related_articles() for each one to fetch and link new articles.
-    
+
     Returns:
         dict: A dictionary containing statistics about the update operation:
               - stories_updated: Number of stories that received new articles
               - new_articles: Total number of new articles added across all stories
     """
-    print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Starting update of all tracked stories")
+    logger.debug("Starting update of all tracked stories")
     try:
         # Get all tracked stories
         result = supabase.table("tracked_stories") \
             .select("id, keyword") \
             .execute()
-        
+
         tracked_stories = result.data if result.data else []
-        print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Found {len(tracked_stories)} tracked stories to update")
-        
+        logger.debug("Found %s tracked stories to update", len(tracked_stories))
+
         if not tracked_stories:
             return {"stories_updated": 0, "new_articles": 0}
-        
-        # Update each tracked story
+
+        # Preload every story's linked article IDs in one query; the links
+        # can't change mid-sweep except by our own inserts, so this replaces
+        # a per-story lookup inside each find_related_articles call
+        links_result = supabase.table("tracked_story_articles") \
+            .select("tracked_story_id, news_id") \
+            .execute()
+        existing_by_story = {}
+        for link in links_result.data or []:
+            existing_by_story.setdefault(link["tracked_story_id"], set()).add(link["news_id"])
+
+        # Fan each story's refresh out on the discovery pool instead of
+        # refreshing them one after another; each refresh is dominated by
+        # fetch_news and Supabase round trips that overlap cleanly
+        futures = [
+            _discovery_pool.submit(
+                find_related_articles, story["id"], story["keyword"],
+                existing_by_story.get(story["id"], set()))
+            for story in tracked_stories
+        ]
+
         stories_updated = 0
         total_new_articles = 0
-        
-        for story in tracked_stories:
-            print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Updating story {story['id']}, keyword: '{story['keyword']}'")
-            new_articles = find_related_articles(story["id"], story["keyword"])
+        for story, future in zip(tracked_stories, futures):
+            try:
+                new_articles = future.result()
+            except Exception as e:
+                logger.error("Error updating story %s: %s", story['id'], e)
+                continue
             if new_articles > 0:
                 stories_updated += 1
                 total_new_articles += new_articles
-                print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Added {new_articles} new articles to story {story['id']}")
-            else:
-                print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] No new articles found for story {story['id']}")
-        
-        print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Update complete. Updated {stories_updated} stories with {total_new_articles} new articles")
+
+        logger.info("Update complete. Updated %s stories with %s new articles", stories_updated, total_new_articles)
         return {
             "stories_updated": stories_updated,
             "new_articles": total_new_articles
         }
-    
+
     except Exception as e:
-        print(f"[DEBUG] [story_tracking_service] [update_all_tracked_stories] Error updating tracked stories: {str(e)}")
+        logger.error("Error updating tracked stories: %s", e)
         raise e
 
 if __name__ == '__main__':
     # Example usage - this code runs when the script is executed directly
-    print("[DEBUG] [story_tracking_service] [main] Running story_tracking_service.py as main")
     result = update_all_tracked_stories()
-    print(f"[DEBUG] [story_tracking_service] [main] Updated {result['stories_updated']} stories with {result['new_articles']} new articles")
-    print("[DEBUG] [story_tracking_service] [main] Execution completed")
+    logger.info("Updated %s stories with %s new articles", result['stories_updated'], result['new_articles'])
@@ -12,11 +12,20 @@ Key Features:
 - Integration with Supabase for data persistence
 """
 
-import json
+import functools
+import hashlib
+import orjson
+import re
 import requests
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from cachetools import LRUCache
 import openai
+from backend.core import cache
+from backend.core.cache import redis_cache
 from backend.core.config import Config
+from backend.core.http import session
 from backend.core.utils import setup_logger, log_exception
 import yake
 import os
@@ -29,15 +38,32 @@ openai.api_key = Config.OPENAI_API_KEY
 
 # No need to instantiate a client object; we'll use openai.ChatCompletion.create directly.
 
-from supabase import create_client, Client  # Make sure you're using supabase-py or your preferred client
+# Reuse the storage module's Supabase client rather than creating a second
+# one: both talk to the same project with the same key, and sharing the client
+# shares its underlying HTTP connection pool so calls from this module reuse
+# already-established TLS connections.
+from backend.microservices.news_storage import supabase
 
-from dotenv import load_dotenv
-load_dotenv('../../.env')  # Optional: Only use this for local development.
+# Built once rather than per fetch; kept a per-request header (not set on the
+# shared session) because the session is also used for API calls that
+# shouldn't advertise a browser UA.
+_SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
 
-# Use your service key here for secure server-side operations.
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Cap on how much of a page gets read: article text lives well inside 2 MB,
+# and the cap keeps a pathological or adversarial page from ballooning a
+# worker's memory mid-batch.
+_MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+
+# More paragraphs than any article body plus boilerplate needs; with the
+# summarizer's input budget, text past this point would be clipped anyway.
+_MAX_ARTICLE_PARAGRAPHS = 400
+
+# Compiled once; bound method lookup hoisted too. Anchored on the full
+# scheme, unlike the old startswith('http'), which also let schemes like
+# httpfoo:// through.
+_URL_OK = re.compile(r'https?://').match
 
 
 @log_exception(logger)
@@ -53,24 +79,46 @@ def fetch_article_content(url):
                     Returns None if the fetch fails or content is invalid.
     """
     try:
-        if not url or not url.startswith('http'):
+        if not url or not _URL_OK(url):
             logger.error(f"Invalid URL format: {url}")
             return None
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        paragraphs = soup.find_all('p')
-        
+        # Shared pooled session: article hosts get keep-alive reuse and
+        # transient 5xx retries instead of a fresh connection per fetch.
+        # stream=True defers the body download so non-HTML responses can be
+        # rejected from the headers alone.
+        with session.get(url, headers=_SCRAPE_HEADERS, timeout=10, stream=True) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'html' not in content_type.lower():
+                logger.warning(f"Skipping non-HTML content ({content_type}) at URL: {url}")
+                return None
+
+            # Feed the download through lxml's pull parser chunk by chunk:
+            # <p> text is extracted as bytes arrive (parse CPU overlaps
+            # network wait), only one 64 KB chunk is ever buffered, and the
+            # loop stops early once it has enough paragraphs or hits the
+            # byte cap — the page's tail never even downloads.
+            parser = etree.HTMLPullParser(events=('end',), tag='p')
+            paragraphs = []
+            bytes_read = 0
+            for chunk in response.iter_content(65536):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    text = ' '.join(element.itertext()).strip()
+                    if text:
+                        paragraphs.append(text)
+                    element.clear()
+                bytes_read += len(chunk)
+                if bytes_read >= _MAX_ARTICLE_BYTES or len(paragraphs) >= _MAX_ARTICLE_PARAGRAPHS:
+                    break
+
         if not paragraphs:
             logger.warning(f"No content found at URL: {url}")
             return None
-            
-        content = ' '.join([p.get_text() for p in paragraphs])
+
+        content = ' '.join(paragraphs)
         return content
         
     except requests.exceptions.Timeout:
@@ -90,6 +138,72 @@ def fetch_article_content(url):
         return None
 
 
+# Summaries for identical text are reusable: temperature 0 makes the model
+# deterministic for a given input, so a summary computed once is the summary.
+# Two tiers — a process-local LRU for the hottest repeats, and Redis so
+# summaries survive restarts and are shared across workers. Both are keyed
+# by a digest of model, temperature and text, so 4096 LRU entries hold 4096
+# hashes rather than article bodies, and a model change never serves a
+# stale summary.
+_SUMMARIZER_MODEL = Config.SUMMARIZER_MODEL
+_SUMMARIZER_TEMPERATURE = 0
+_SUMMARY_CACHE_TTL = 7 * 86400
+_SUMMARIZER_TIMEOUT = 15  # seconds per article's worth of API wait
+
+# Input budget for a single summary, in characters (~4 chars/token, so this
+# approximates a 4k-token budget without pulling in tiktoken). Scraped pages
+# concatenate every <p> on the page — navigation, comments, related-article
+# teasers — and a 150-word summary gains nothing from the tail, so clipping
+# caps token cost and latency. Clipping happens before the cache key is
+# computed so differently-padded copies of the same lead text share an entry.
+_MAX_SUMMARY_INPUT_CHARS = 16_000
+
+
+def _clip(text):
+    """Clip text to the summarizer's input budget at a word boundary."""
+    if len(text) <= _MAX_SUMMARY_INPUT_CHARS:
+        return text
+    clipped = text[:_MAX_SUMMARY_INPUT_CHARS]
+    cut = clipped.rfind(' ')
+    return clipped[:cut] if cut > 0 else clipped
+_summary_cache = LRUCache(maxsize=4096)
+_summary_cache_lock = threading.Lock()
+
+
+def _summary_key(text):
+    """Digest identifying a summarization request for cache lookups."""
+    h = hashlib.sha256()
+    h.update(f"{_SUMMARIZER_MODEL}|{_SUMMARIZER_TEMPERATURE}|".encode())
+    h.update(text.encode())
+    return h.hexdigest()
+
+
+@redis_cache(key_fn=lambda key, text: f"sum:{key}", ttl=_SUMMARY_CACHE_TTL)
+def _summarize_remote(key, text):
+    """Call OpenAI for a summary; cached in Redis under the request digest.
+
+    Returns None on failure so errors are never cached and the next caller
+    retries the API.
+    """
+    try:
+        response = openai.ChatCompletion.create(
+            model=_SUMMARIZER_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that summarizes text in approximately 150 words."},
+                {"role": "user", "content": f"Please summarize the following text:\n\n{text}"}
+            ],
+            max_tokens=200,
+            temperature=_SUMMARIZER_TEMPERATURE,
+            # Bound the wait explicitly; the library default lets a stalled
+            # API call hold a pool worker for minutes
+            request_timeout=_SUMMARIZER_TIMEOUT
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        logger.error(f"Error in summarization: {str(e)}")
+        return None
+
+
 @log_exception(logger)
 def run_summarization(text):
     """
@@ -100,27 +214,158 @@ def run_summarization(text):
 
     Returns:
         str: A summarized version of the input text (approximately 150 words).
-             Returns an error message if summarization fails.
+             Falls back to the article's lead text if summarization fails.
 
     Note:
-        Uses OpenAI's GPT-4 (or your specified model) with specific parameters:
-        - Temperature: 0.5
-        - Max tokens: 200
+        Repeat summarizations of identical text are served from an in-process
+        LRU, then Redis, before the OpenAI API is consulted; the model call
+        is by far the most expensive thing this service does (seconds of
+        latency plus per-token billing).
     """
-    try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4o-mini",  # Change to your desired model (e.g., "gpt-3.5-turbo")
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that summarizes text in approximately 150 words."},
-                {"role": "user", "content": f"Please summarize the following text:\n\n{text}"}
-            ],
-            max_tokens=200,
-            temperature=0.5
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        logger.error(f"Error in summarization: {str(e)}")
-        return "Error generating summary"
+    text = _clip(text)
+    key = _summary_key(text)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+    if cached is not None:
+        return cached
+    summary = _summarize_remote(key, text)
+    if summary is None:
+        # Deterministic fallback: the article's lead text, so a stalled or
+        # failing API degrades to something readable instead of an error
+        # string. Never cached, so the next request retries the model.
+        if len(text) <= 400:
+            return text
+        lead = text[:400]
+        cut = lead.rfind(' ')
+        return (lead[:cut] if cut > 0 else lead) + '...'
+    with _summary_cache_lock:
+        _summary_cache[key] = summary
+    return summary
+
+
+# Batch sizing: enough articles to amortize the per-request overhead and
+# rate-limit bookkeeping, small enough that the prompt stays well inside the
+# model's context window and one bad article can't sink many others.
+_BATCH_MAX_ARTICLES = 8
+_BATCH_MAX_CHARS = 48_000
+
+
+def _summarize_batch_remote(texts):
+    """Summarize several texts in one OpenAI request.
+
+    The articles go up numbered in a single prompt and come back as a JSON
+    object mapping each number to its summary, so N articles cost one HTTP
+    round trip instead of N.
+
+    Args:
+        texts (list): The article texts to summarize.
+
+    Returns:
+        list: One summary per input text, in order.
+
+    Raises:
+        Exception: If the API call fails or the response isn't the expected
+            JSON shape; callers fall back to per-article summarization.
+    """
+    numbered = "\n\n".join(f"Article {i}:\n{text}" for i, text in enumerate(texts))
+    response = openai.ChatCompletion.create(
+        model=_SUMMARIZER_MODEL,
+        messages=[
+            {"role": "system", "content": (
+                "You are a helpful assistant that summarizes news articles. "
+                "Summarize each numbered article below in approximately 150 words. "
+                'Respond with a JSON object mapping each article number to its '
+                'summary, e.g. {"0": "...", "1": "..."}.')},
+            {"role": "user", "content": numbered}
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=250 * len(texts),
+        temperature=_SUMMARIZER_TEMPERATURE,
+        # Scaled with batch size: a batch response streams more tokens than
+        # a single summary but should still never hold a worker for minutes
+        request_timeout=_SUMMARIZER_TIMEOUT * len(texts)
+    )
+    parsed = orjson.loads(response.choices[0].message.content)
+    return [parsed[str(i)].strip() for i in range(len(texts))]
+
+
+def summarize_many(texts):
+    """Summaries for a list of texts, batching cache misses into shared requests.
+
+    Cache hits (LRU, then Redis) are served individually; the remaining
+    misses are grouped into bounded batches that each cost one API round
+    trip. If a batch call fails, its articles fall back to per-article
+    run_summarization so one malformed response never loses a whole batch.
+
+    Args:
+        texts (list): The article texts to summarize.
+
+    Returns:
+        list: One summary per input text, in order.
+    """
+    summaries = [None] * len(texts)
+    pending = []
+    for i, text in enumerate(texts):
+        text = _clip(text)
+        key = _summary_key(text)
+        with _summary_cache_lock:
+            hit = _summary_cache.get(key)
+        if hit is None:
+            hit = cache.get(f"sum:{key}")
+            if hit is not None:
+                with _summary_cache_lock:
+                    _summary_cache[key] = hit
+        if hit is not None:
+            summaries[i] = hit
+        else:
+            pending.append((i, key, text))
+
+    # Greedy batching bounded by article count and total prompt size
+    batch = []
+    batch_chars = 0
+    batches = []
+    for entry in pending:
+        text_len = len(entry[2])
+        if batch and (len(batch) >= _BATCH_MAX_ARTICLES or batch_chars + text_len > _BATCH_MAX_CHARS):
+            batches.append(batch)
+            batch, batch_chars = [], 0
+        batch.append(entry)
+        batch_chars += text_len
+    if batch:
+        batches.append(batch)
+
+    for batch in batches:
+        if len(batch) == 1:
+            i, key, text = batch[0]
+            summaries[i] = run_summarization(text)
+            continue
+        try:
+            results = _summarize_batch_remote([text for _, _, text in batch])
+        except Exception as e:
+            logger.error(f"Batch summarization failed, falling back to per-article: {str(e)}")
+            for i, key, text in batch:
+                summaries[i] = run_summarization(text)
+            continue
+        for (i, key, text), summary in zip(batch, results):
+            summaries[i] = summary
+            with _summary_cache_lock:
+                _summary_cache[key] = summary
+        # One pipelined round trip writes the whole batch back to Redis
+        cache.put_many(
+            {f"sum:{key}": summary for (_, key, _), summary in zip(batch, results)},
+            _SUMMARY_CACHE_TTL)
+    return summaries
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_extractor(num_keywords):
+    """Return a shared YAKE extractor for the given keyword count.
+
+    Constructing a KeywordExtractor loads stopword lists and builds internal
+    state, so memoizing per num_keywords makes every call after the first
+    reuse the same instance instead of rebuilding it per article.
+    """
+    return yake.KeywordExtractor(top=num_keywords, lan='en')
 
 
 @log_exception(logger)
@@ -135,64 +380,98 @@ def get_keywords(text, num_keywords=1):
     Returns:
         list: A list of extracted keywords/key phrases.
     """
-    kw_extractor = yake.KeywordExtractor(top=num_keywords, lan='en')
-    keywords = kw_extractor.extract_keywords(text)
+    keywords = _keyword_extractor(num_keywords).extract_keywords(text)
     return [kw[0] for kw in keywords]
 
 
+# Content fetches are one to two seconds of network wait each; eight
+# workers overlap them so a session's fetch phase costs roughly its
+# slowest article.
+_process_pool = ThreadPoolExecutor(max_workers=8)
+
+
+# Stored content at least this long is summarized as-is; anything shorter is
+# likely a truncated API snippet ("[+1234 chars]") worth re-scraping. Skipping
+# the fetch saves a TCP+TLS round trip and an HTML parse per article.
+_MIN_USABLE_CONTENT_CHARS = 1200
+
+
+def _resolve_content(article):
+    """Return an article's text, scraping its URL only when the stored
+    content is missing or too thin to summarize."""
+    content = article.get('content') or ''
+    if len(content) < _MIN_USABLE_CONTENT_CHARS:
+        fetched = fetch_article_content(article['url'])
+        if fetched:
+            return fetched
+    return content
+
+
 @log_exception(logger)
 def process_articles(session_id):
     """
     Processes a batch of articles associated with a specific session ID.
-    
+
     This function performs the following operations:
     1. Retrieves articles from Supabase based on the session ID.
     2. Fetches missing content for articles if needed.
     3. Generates summaries for each article.
     4. Extracts keywords for filtering.
-    
+
+    Content fetches run concurrently on a thread pool and the summaries for
+    a session are batched into shared OpenAI requests, so the wall-clock for
+    a session is roughly one fetch plus a couple of model round trips
+    instead of the per-article sum.
+
     Args:
         session_id (str): The unique identifier for the user session.
 
     Returns:
-        list: A list of dictionaries containing processed article data.
+        list: A list of dictionaries containing processed article data,
+              in the same order the articles were retrieved.
     """
     try:
         history_result = supabase.table("user_search_history").select("news_id").eq("session_id", session_id).execute()
-        article_ids = [record["news_id"] for record in history_result.data]
+        # A session's history can log the same article several times; dedupe
+        # (order-preserving) so each is fetched and summarized once.
+        # Identical content across different rows is already collapsed by
+        # run_summarization's hash-keyed cache.
+        article_ids = list(dict.fromkeys(record["news_id"] for record in history_result.data))
 
         articles = []
         if article_ids:
-            result = supabase.table("news_articles").select("*").in_("id", article_ids).execute()
+            # Only the columns the summary payload reads — "*" would also
+            # drag summary and any other wide fields over the wire per article
+            result = supabase.table("news_articles") \
+                .select("id,title,content,source,published_at,url,image") \
+                .in_("id", article_ids) \
+                .execute()
             articles = result.data
 
-        summarized_articles = []
-        for article in articles:
-            logger.info(f"Processing article: {article['title']}")
-            
-            content = article.get('content')
-            if not content:
-                content = fetch_article_content(article['url'])
-            
-            if content:
-                summary = run_summarization(content)
-            else:
-                summary = run_summarization(article.get('content', ''))
-            
-            summarized_articles.append({
-                'id': article['id'],
-                'title': article['title'],
-                'author': article.get('author', 'Unknown Author'),
-                'source': article.get('source'),
-                'publishedAt': article.get('published_at'),
-                'url': article['url'],
-                'urlToImage': article.get('image'),
-                'content': article.get('content', ''),
-                'summary': summary,
-                'filter_keywords': get_keywords(article.get('content', ''))
-            })
-
-        return summarized_articles
+        contents = list(_process_pool.map(_resolve_content, articles))
+
+        # Kick keyword extraction onto the pool before the summarization
+        # round trips start: YAKE is pure CPU, so it runs while this thread
+        # is parked on the OpenAI calls instead of serially afterwards
+        keyword_futures = [
+            _process_pool.submit(get_keywords, article.get('content', ''))
+            for article in articles
+        ]
+        summaries = summarize_many(contents)
+        keywords = [future.result() for future in keyword_futures]
+
+        return [{
+            'id': article['id'],
+            'title': article['title'],
+            'author': article.get('author', 'Unknown Author'),
+            'source': article.get('source'),
+            'publishedAt': article.get('published_at'),
+            'url': article['url'],
+            'urlToImage': article.get('image'),
+            'content': article.get('content', ''),
+            'summary': summary,
+            'filter_keywords': article_keywords
+        } for article, summary, article_keywords in zip(articles, summaries, keywords)]
 
     except Exception as e:
         logger.error(f"Error processing articles: {str(e)}")
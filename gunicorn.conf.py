@@ -0,0 +1,22 @@
+"""Shared gunicorn configuration for the gateway and microservices.
+
+gevent workers because every service is I/O-bound on Supabase, the News API
+and OpenAI: monkey-patched sockets let one worker overlap many in-flight
+requests instead of queuing them behind a single blocking call. The gateway's
+wsgi.py applies the monkey patch before any app import.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+    gunicorn -c gunicorn.conf.py backend.microservices.ingestion_service:app
+"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:%s" % os.getenv("PORT", "8080")
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_connections = 1000
+# Import the app once in the master so forked workers share pages
+# copy-on-write (pairs with the warm-up in wsgi.py)
+preload_app = True